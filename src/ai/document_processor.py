@@ -1,8 +1,13 @@
 import fitz  # PyMuPDF
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from loguru import logger
 import hashlib
+import os
+
+# Text-only extraction flags: no TEXT_PRESERVE_IMAGES, so MuPDF never decodes images
+_TEXT_FLAGS = fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
 
 class DocumentProcessor:
     """
@@ -29,27 +34,26 @@ class DocumentProcessor:
         logger.info(f"Processing PDF: {file_path.name}")
         
         try:
-            doc = fitz.open(file_path)
             all_chunks = []
 
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                text = page.get_text()
-                
-                # Basic chunking by paragraph for now
-                chunks = self._chunk_text(text, page_num)
-                
-                for chunk_text in chunks:
-                    chunk_id = self._generate_id(file_path.name, page_num, chunk_text)
-                    all_chunks.append({
-                        "id": chunk_id,
-                        "text": chunk_text,
-                        "metadata": {
-                            "source": file_path.name,
-                            "page": page_num + 1,
-                            "file_path": str(file_path)
-                        }
-                    })
+            with fitz.open(file_path, filetype="pdf") as doc:
+                for page_num, page in enumerate(doc):
+                    # MuPDF already splits the page into paragraph blocks
+                    blocks = page.get_text("blocks", flags=_TEXT_FLAGS)
+
+                    chunks = self._chunk_blocks(blocks)
+
+                    for chunk_text in chunks:
+                        chunk_id = self._generate_id(file_path.name, page_num, chunk_text)
+                        all_chunks.append({
+                            "id": chunk_id,
+                            "text": chunk_text,
+                            "metadata": {
+                                "source": file_path.name,
+                                "page": page_num + 1,
+                                "file_path": str(file_path)
+                            }
+                        })
             
             logger.success(f"Extracted {len(all_chunks)} chunks from {file_path.name}")
             return all_chunks
@@ -58,13 +62,38 @@ class DocumentProcessor:
             logger.exception(f"Failed to process PDF {file_path}: {e}")
             return []
 
-    def _chunk_text(self, text: str, page_num: int) -> List[str]:
-        """Split text into manageable chunks."""
-        # Simple splitting by double newlines to find paragraphs
-        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-        return paragraphs
+    def process_files(self, file_paths: List[Path], max_workers: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Process several PDF files in parallel worker processes.
+
+        Args:
+            file_paths: Absolute paths to the PDF files.
+            max_workers: Worker process count (defaults to CPU count).
+
+        Returns:
+            One list of chunks per input file, in the same order as file_paths.
+        """
+        file_paths = [Path(p) for p in file_paths]
+        if len(file_paths) < 2:
+            return [self.process_file(p) for p in file_paths]
+
+        workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.process_file, file_paths))
+
+    def _chunk_blocks(self, blocks: List[tuple]) -> List[str]:
+        """Turn PyMuPDF text blocks into chunks (one chunk per paragraph block)."""
+        # Block tuples are (x0, y0, x1, y1, text, block_no, block_type); type 1 is an image
+        chunks = []
+        for block in blocks:
+            if block[6] != 0:
+                continue
+            text = block[4].strip()
+            if text:
+                chunks.append(text)
+        return chunks
 
     def _generate_id(self, filename: str, page: int, content: str) -> str:
         """Generate a deterministic ID for a chunk."""
         unique_str = f"{filename}_{page}_{content[:50]}"
-        return hashlib.md5(unique_str.encode()).hexdigest()
+        return hashlib.blake2b(unique_str.encode(), digest_size=16).hexdigest()
@@ -32,20 +32,23 @@ class DrawingProcessor:
             
             extracted_text = []
             
-            # Extract MTEXT and TEXT entities
-            for entity in msp.query('TEXT MTEXT'):
-                text_content = entity.dxf.text if entity.dxftype() == 'TEXT' else entity.text
-                if text_content and len(text_content.strip()) > 3: # Filter noise
-                    extracted_text.append({
-                        "id": self._generate_id(file_path.name, text_content),
-                        "text": text_content.strip(),
-                        "metadata": {
-                            "source": file_path.name,
-                            "type": "dwg_text",
-                            "layer": entity.dxf.layer,
-                            "file_path": str(file_path)
-                        }
-                    })
+            # Extract MTEXT and TEXT entities, grouped by layer so the layer
+            # attribute is read once per layer rather than once per entity
+            # (query first, so only text entities are grouped)
+            for layer, entities in msp.query('TEXT MTEXT').groupby(dxfattrib='layer').items():
+                for entity in entities:
+                    text_content = entity.dxf.text if entity.dxftype() == 'TEXT' else entity.text
+                    if text_content and len(text_content.strip()) > 3: # Filter noise
+                        extracted_text.append({
+                            "id": self._generate_id(file_path.name, text_content),
+                            "text": text_content.strip(),
+                            "metadata": {
+                                "source": file_path.name,
+                                "type": "dwg_text",
+                                "layer": layer,
+                                "file_path": str(file_path)
+                            }
+                        })
             
             logger.success(f"Extracted {len(extracted_text)} text entities from {file_path.name}")
             return extracted_text
@@ -56,4 +59,4 @@ class DrawingProcessor:
 
     def _generate_id(self, filename: str, content: str) -> str:
         unique_str = f"{filename}_{content[:50]}"
-        return hashlib.md5(unique_str.encode()).hexdigest()
+        return hashlib.blake2b(unique_str.encode(), digest_size=16).hexdigest()
@@ -44,6 +44,10 @@ class RAGEngine:
             logger.warning(f"Unsupported file type: {file_path.suffix}")
             return
 
+        self._store_chunks(file_path, chunks)
+
+    def _store_chunks(self, file_path: Path, chunks: List[Dict[str, Any]]):
+        """Embed extracted chunks of one file and add them to the vector store."""
         if not chunks:
             logger.warning(f"No content extracted from {file_path.name}")
             return
@@ -94,8 +98,13 @@ class RAGEngine:
             logger.error(f"Directory not found: {directory}")
             return
 
-        files = list(directory.glob("**/*.pdf")) + list(directory.glob("**/*.dwg"))
-        logger.info(f"Found {len(files)} files to ingest in {directory}")
+        pdf_files = list(directory.glob("**/*.pdf"))
+        dwg_files = list(directory.glob("**/*.dwg"))
+        logger.info(f"Found {len(pdf_files) + len(dwg_files)} files to ingest in {directory}")
+
+        # PDF text extraction is CPU bound - run it across processes, embed/store here
+        for file_path, chunks in zip(pdf_files, self.doc_processor.process_files(pdf_files)):
+            self._store_chunks(file_path, chunks)
 
-        for file_path in files:
+        for file_path in dwg_files:
             self.ingest_file(file_path)
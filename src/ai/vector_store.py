@@ -4,6 +4,7 @@ from pathlib import Path
 from loguru import logger
 import chromadb
 from chromadb.config import Settings
+import numpy as np
 import shutil
 
 class VectorStore(ABC):
@@ -28,13 +29,32 @@ class VectorStore(ABC):
 class ChromaDBStore(VectorStore):
     """ChromaDB implementation of VectorStore (Local)."""
 
-    def __init__(self, persist_directory: str = None, collection_name: str = "schmekla_knowledge"):
+    # Large inserts stall Chroma's HNSW index; keep each add() call bounded
+    ADD_BATCH_SIZE = 5000
+
+    def __init__(
+        self,
+        persist_directory: str = None,
+        collection_name: str = "schmekla_knowledge",
+        hnsw_m: int = 8,
+        hnsw_construction_ef: int = 64,
+        hnsw_search_ef: int = 32,
+    ):
         if not persist_directory:
             # Default to .schmekla/knowledge_db in user home
             persist_directory = str(Path.home() / ".schmekla" / "knowledge_db")
         
         self.persist_directory = persist_directory
         self.collection_name = collection_name
+
+        # HNSW index tuning - lighter than Chroma's defaults (M=16, construction_ef=100)
+        # for faster inserts. Only applied when the collection is first created.
+        self.collection_metadata = {
+            "hnsw:space": "cosine",
+            "hnsw:M": hnsw_m,
+            "hnsw:construction_ef": hnsw_construction_ef,
+            "hnsw:search_ef": hnsw_search_ef,
+        }
         
         logger.info(f"Initializing ChromaDB at {self.persist_directory}")
         
@@ -43,7 +63,7 @@ class ChromaDBStore(VectorStore):
         # Get or create collection
         self.collection = self.client.get_or_create_collection(
             name=self.collection_name,
-            metadata={"hnsw:space": "cosine"}
+            metadata=self.collection_metadata
         )
         logger.debug(f"Collection '{self.collection_name}' loaded. Records: {self.collection.count()}")
 
@@ -51,16 +71,24 @@ class ChromaDBStore(VectorStore):
         if not documents:
             return
 
-        try:
-            self.collection.add(
-                documents=documents,
-                metadatas=metadatas,
-                ids=ids,
-                embeddings=embeddings
-            )
-            logger.success(f"Added {len(documents)} documents to vector store.")
-        except Exception as e:
-            logger.error(f"Failed to add documents to ChromaDB: {e}")
+        added = 0
+        for start in range(0, len(documents), self.ADD_BATCH_SIZE):
+            end = start + self.ADD_BATCH_SIZE
+            try:
+                # Single float32 array - Chroma can take it without per-row list conversion
+                batch_embeddings = np.asarray(embeddings[start:end], dtype=np.float32)
+                self.collection.add(
+                    documents=documents[start:end],
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end],
+                    embeddings=batch_embeddings
+                )
+                added += len(documents[start:end])
+            except Exception as e:
+                logger.error(f"Failed to add documents {start}-{min(end, len(documents))} to ChromaDB: {e}")
+
+        if added:
+            logger.success(f"Added {added} documents to vector store.")
 
     def query(self, query_embeddings: List[List[float]], n_results: int = 5, where: Dict = None) -> Dict[str, Any]:
         try:
@@ -80,5 +108,8 @@ class ChromaDBStore(VectorStore):
     def reset(self):
         """DANGER: Delete entire collection."""
         self.client.delete_collection(self.collection_name)
-        self.collection = self.client.get_or_create_collection(self.collection_name)
+        self.collection = self.client.get_or_create_collection(
+            name=self.collection_name,
+            metadata=self.collection_metadata
+        )
         logger.warning(f"Collection '{self.collection_name}' has been RESET.")
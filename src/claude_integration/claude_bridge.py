@@ -9,13 +9,138 @@ import shutil
 import json
 import re
 import os
+import stat
 import sys
-from typing import List, Dict, Any, Optional
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Deque, List, Dict, Any, Optional
 from pathlib import Path
+from uuid import UUID
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.core.model import StructuralModel
 from src.core.element import ElementType
+from src.core.beam import Beam
+from src.core.column import Column
+from src.core.curved_beam import CurvedBeam, create_barrel_hoop
+from src.core.footing import Footing
+from src.core.plate import Plate
+from src.core.slab import Slab
+from src.core.wall import Wall
+from src.core.profile import Profile
+from src.core.material import Material
+from src.geometry.point import Point3D
+
+# Windows paths like C:\..., or relative paths
+_PATH_RE = re.compile(r'([A-Za-z]:\\[^\s\'"<>|*?]+|\.{1,2}[\\/][^\s\'"<>|*?]+)')
+
+# File suffixes handled when reading referenced files/folders
+_BINARY_SUFFIXES = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.pdf'})
+_TEXT_SUFFIXES = frozenset({'.txt', '.md', '.json', '.csv', '.xml', '.yaml', '.yml'})
+_DRAWING_SUFFIXES = frozenset({'.png', '.jpg', '.jpeg', '.pdf', '.dwg', '.dxf'})
+
+# Seconds to wait for the Claude CLI (complex prompts can take minutes)
+_CLI_TIMEOUT = 180
+
+# Opening fence of a command block in Claude's response
+_COMMAND_FENCE = "```schmekla-command"
+_JSON_DECODER = json.JSONDecoder()
+
+# Static parts of the system prompt; only the model context, file context
+# and user request change between calls
+_PROMPT_INTRO = """You are a structural engineering AI assistant integrated into Schmekla, a 3D structural modeling application.
+
+Your role is to help users create and modify structural models by:
+1. Understanding their requirements (from text descriptions, specifications, or file contents)
+2. Generating commands to create structural elements (beams, columns, slabs, etc.)
+3. Providing engineering guidance
+
+## Current Model State:
+"""
+
+_PROMPT_COMMANDS = """
+
+## How to Create Elements:
+Output commands in this JSON format - you can include multiple commands:
+```schmekla-command
+{"command": "create_beam", "params": {"start": [0,0,0], "end": [6000,0,0], "profile": "UB 305x165x40"}}
+```
+
+## Available Commands:
+
+### Structural Elements:
+- **create_column**: Vertical support
+  - Params: base [x,y,z], height (mm), profile, material (optional), rotation (optional), name (optional)
+
+- **create_beam**: Horizontal/inclined beam
+  - Params: start [x,y,z], end [x,y,z], profile, material (optional), name (optional)
+
+- **create_curved_beam**: Arc/curved beam
+  - Params: start [x,y,z], end [x,y,z], rise (mm), profile, segments (optional), name (optional)
+
+- **create_slab**: Floor/roof slab
+  - Params: points [[x,y,z],...] OR origin + width + length, thickness (mm), slab_type ("floor"/"roof"), name (optional)
+
+- **create_wall**: Wall element
+  - Params: start [x,y,z], end [x,y,z], height (mm), thickness (mm), wall_type ("standard"/"shear"/"retaining"), name (optional)
+
+- **create_footing**: Foundation
+  - Params: center [x,y,z], width (mm), length (mm), depth (mm), footing_type ("pad"/"strip"/"mat"), name (optional)
+
+- **create_plate**: Steel plate
+  - Params: points [[x,y,z],...] OR origin + width + length, thickness (mm), name (optional)
+
+### Assemblies:
+- **create_portal_frame**: Complete portal frame
+  - Params: width (mm), height (mm), profile_beam, profile_column, origin [x,y,z]
+
+- **create_barrel_canopy**: Barrel vault canopy structure
+  - Params: origin, width, length, eaves_height, apex_height, num_bays, column_profile, hoop_profile
+
+### Modification:
+- **modify_element**: Change element property
+  - Params: element_id, property, value
+- **delete_element**: Remove element
+  - Params: element_id
+
+## Units & Profiles:
+- All dimensions in **millimeters (mm)**
+- Profiles: "UB 305x165x40", "UB 406x178x54", "UC 203x203x46", "UC 254x254x73", "SHS 100x100x5", "RHS 200x100x6", "CHS 168.3x7.1", "PFC 200x90x30"
+- Materials: "S355" (steel), "C30/37" (concrete)
+
+## User Request:
+"""
+
+_PROMPT_OUTRO = """
+
+Analyze the request and any provided files. If the user wants to create a structural model, output the appropriate schmekla-command blocks. Explain what you're creating.
+"""
+
+
+@lru_cache(maxsize=256)
+def _parse_uuid(value: str) -> UUID:
+    """Parse an element ID string (cached - commands often repeat the same IDs)."""
+    return UUID(value)
+
+
+def _to_uuid(value: Any) -> UUID:
+    """Convert a command's element_id parameter to a UUID."""
+    if isinstance(value, UUID):
+        return value
+    return _parse_uuid(value)
+
+
+def _applied_note(applied: List[str]) -> str:
+    """Describe commands that already ran before the CLI call failed."""
+    if not applied:
+        return ""
+    return "\n\nCommands already applied to the model: " + ", ".join(applied)
 
 
 class ClaudeBridge:
@@ -33,8 +158,26 @@ class ClaudeBridge:
             model: Schmekla model to operate on
         """
         self.model = model
-        self.conversation_history: List[Dict[str, str]] = []
         self.max_history = 50
+        # Oldest messages drop off automatically once max_history is reached
+        self.conversation_history: Deque[Dict[str, str]] = deque(maxlen=self.max_history)
+        self._claude_exe: Optional[str] = None  # Cached CLI path (see _get_claude_cli)
+
+        # Command name -> handler
+        self._dispatch = {
+            "create_beam": self._cmd_create_beam,
+            "create_curved_beam": self._cmd_create_curved_beam,
+            "create_hoop": self._cmd_create_hoop,
+            "create_column": self._cmd_create_column,
+            "create_plate": self._cmd_create_plate,
+            "create_slab": self._cmd_create_slab,
+            "create_wall": self._cmd_create_wall,
+            "create_footing": self._cmd_create_footing,
+            "create_portal_frame": self._cmd_create_portal_frame,
+            "create_barrel_canopy": self._cmd_create_barrel_canopy,
+            "delete_element": self._cmd_delete_element,
+            "modify_element": self._cmd_modify_element,
+        }
 
     def send_prompt(self, user_prompt: str) -> str:
         """
@@ -51,17 +194,10 @@ class ClaudeBridge:
         # Build full prompt with context
         full_prompt = self._build_full_prompt(user_prompt)
 
-        # Call Claude CLI
-        response = self._call_claude_cli(full_prompt)
-
-        # Parse and execute any commands
-        commands = self._extract_commands(response)
-        for cmd in commands:
-            try:
-                result = self._execute_command(cmd)
-                logger.debug(f"Executed command: {cmd['command']} -> {result}")
-            except Exception as e:
-                logger.error(f"Failed to execute command: {e}")
+        # Call Claude CLI - commands are executed as their blocks stream in.
+        # The read loop invokes the callback on this (the model's owning) thread,
+        # so the model is never mutated and its signals never emitted elsewhere.
+        response = self._call_claude_cli(full_prompt, on_command=self._run_command)
 
         # Store in history
         self._add_to_history("user", user_prompt)
@@ -69,6 +205,14 @@ class ClaudeBridge:
 
         return response
 
+    def _run_command(self, cmd: Dict):
+        """Execute one extracted command, logging rather than raising on failure."""
+        try:
+            result = self._execute_command(cmd)
+            logger.debug("Executed command: {} -> {}", cmd['command'], result)
+        except Exception as e:
+            logger.error(f"Failed to execute command: {e}")
+
     def _extract_and_read_files(self, user_prompt: str) -> str:
         """
         Extract file/folder paths from user prompt and read their contents.
@@ -79,11 +223,11 @@ class ClaudeBridge:
         Returns:
             String containing file contents, or empty string
         """
-        import re
+        # Cheap substring check first - most prompts contain no paths at all
+        if not (":\\" in user_prompt or "./" in user_prompt or ".\\" in user_prompt):
+            return ""
 
-        # Match Windows paths like C:\..., or relative paths
-        path_pattern = r'([A-Za-z]:\\[^\s\'"<>|*?]+|\.{1,2}[\\/][^\s\'"<>|*?]+)'
-        matches = re.findall(path_pattern, user_prompt)
+        matches = _PATH_RE.findall(user_prompt)
 
         if not matches:
             return ""
@@ -93,12 +237,18 @@ class ClaudeBridge:
         for path_str in matches:
             path = Path(path_str)
             try:
-                if path.is_file():
+                # One stat per path - mode bits and size are reused below
+                try:
+                    st = os.stat(path_str)
+                except OSError:
+                    continue
+
+                if stat.S_ISREG(st.st_mode):
                     # Read file
-                    content = self._read_file_safely(path)
+                    content = self._read_file_safely(path, st=st)
                     if content:
                         file_contents.append(f"### File: {path.name}\n```\n{content}\n```")
-                elif path.is_dir():
+                elif stat.S_ISDIR(st.st_mode):
                     # Read directory contents
                     dir_contents = self._read_directory(path)
                     if dir_contents:
@@ -111,18 +261,29 @@ class ClaudeBridge:
             return "\n\n## Referenced Files/Folders:\n" + "\n\n".join(file_contents)
         return ""
 
-    def _read_file_safely(self, path: Path, max_size: int = 50000) -> Optional[str]:
-        """Read a file with size limits."""
+    def _read_file_safely(
+        self, path: Path, max_size: int = 50000, st: Optional[os.stat_result] = None
+    ) -> Optional[str]:
+        """Read a file with size limits (pass a known stat result to skip re-stat)."""
         try:
-            if path.stat().st_size > max_size:
-                return f"[File too large: {path.stat().st_size} bytes, max {max_size}]"
+            if st is None:
+                st = path.stat()
+            if st.st_size > max_size:
+                return f"[File too large: {st.st_size} bytes, max {max_size}]"
 
             # Handle different file types
-            suffix = path.suffix.lower()
-            if suffix in {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.pdf'}:
+            suffix = os.path.splitext(path.name)[1].lower()
+            if suffix in _BINARY_SUFFIXES:
                 return f"[Binary file: {suffix} - use Plan Import for images]"
 
-            return path.read_text(encoding='utf-8', errors='replace')
+            # Size is already known, so a single raw read replaces open/fstat/buffered read
+            fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                data = os.read(fd, st.st_size)
+            finally:
+                os.close(fd)
+            # Match read_text's universal newline handling
+            return data.decode('utf-8', errors='replace').replace('\r\n', '\n').replace('\r', '\n')
         except Exception as e:
             return f"[Error reading: {e}]"
 
@@ -131,19 +292,25 @@ class ClaudeBridge:
         contents = []
         files_read = 0
 
-        for item in sorted(path.iterdir()):
+        # DirEntry caches file type (and stat on Windows) from the directory read
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+
+        total = len(entries)
+        for index, entry in enumerate(entries):
             if files_read >= max_files:
-                contents.append(f"\n... and {len(list(path.iterdir())) - max_files} more files")
+                # Entries not yet visited, counted from the list already in memory
+                contents.append(f"\n... and {total - index} more files")
                 break
 
-            if item.is_file():
-                suffix = item.suffix.lower()
-                if suffix in {'.txt', '.md', '.json', '.csv', '.xml', '.yaml', '.yml'}:
-                    content = self._read_file_safely(item, max_size=20000)
-                    contents.append(f"#### {item.name}\n```\n{content}\n```")
+            if entry.is_file():
+                suffix = os.path.splitext(entry.name)[1].lower()
+                if suffix in _TEXT_SUFFIXES:
+                    content = self._read_file_safely(Path(entry.path), max_size=20000, st=entry.stat())
+                    contents.append(f"#### {entry.name}\n```\n{content}\n```")
                     files_read += 1
-                elif suffix in {'.png', '.jpg', '.jpeg', '.pdf', '.dwg', '.dxf'}:
-                    contents.append(f"#### {item.name}\n[Image/Drawing file - use Plan Import feature]")
+                elif suffix in _DRAWING_SUFFIXES:
+                    contents.append(f"#### {entry.name}\n[Image/Drawing file - use Plan Import feature]")
                     files_read += 1
 
         return "\n".join(contents) if contents else "[Empty or no readable files]"
@@ -155,71 +322,10 @@ class ClaudeBridge:
         # Read any referenced files
         file_context = self._extract_and_read_files(user_prompt)
 
-        system_prompt = f"""You are a structural engineering AI assistant integrated into Schmekla, a 3D structural modeling application.
-
-Your role is to help users create and modify structural models by:
-1. Understanding their requirements (from text descriptions, specifications, or file contents)
-2. Generating commands to create structural elements (beams, columns, slabs, etc.)
-3. Providing engineering guidance
-
-## Current Model State:
-{context}
-{file_context}
-
-## How to Create Elements:
-Output commands in this JSON format - you can include multiple commands:
-```schmekla-command
-{{"command": "create_beam", "params": {{"start": [0,0,0], "end": [6000,0,0], "profile": "UB 305x165x40"}}}}
-```
-
-## Available Commands:
-
-### Structural Elements:
-- **create_column**: Vertical support
-  - Params: base [x,y,z], height (mm), profile, material (optional), rotation (optional), name (optional)
-
-- **create_beam**: Horizontal/inclined beam
-  - Params: start [x,y,z], end [x,y,z], profile, material (optional), name (optional)
-
-- **create_curved_beam**: Arc/curved beam
-  - Params: start [x,y,z], end [x,y,z], rise (mm), profile, segments (optional), name (optional)
-
-- **create_slab**: Floor/roof slab
-  - Params: points [[x,y,z],...] OR origin + width + length, thickness (mm), slab_type ("floor"/"roof"), name (optional)
-
-- **create_wall**: Wall element
-  - Params: start [x,y,z], end [x,y,z], height (mm), thickness (mm), wall_type ("standard"/"shear"/"retaining"), name (optional)
-
-- **create_footing**: Foundation
-  - Params: center [x,y,z], width (mm), length (mm), depth (mm), footing_type ("pad"/"strip"/"mat"), name (optional)
-
-- **create_plate**: Steel plate
-  - Params: points [[x,y,z],...] OR origin + width + length, thickness (mm), name (optional)
-
-### Assemblies:
-- **create_portal_frame**: Complete portal frame
-  - Params: width (mm), height (mm), profile_beam, profile_column, origin [x,y,z]
-
-- **create_barrel_canopy**: Barrel vault canopy structure
-  - Params: origin, width, length, eaves_height, apex_height, num_bays, column_profile, hoop_profile
-
-### Modification:
-- **modify_element**: Change element property
-  - Params: element_id, property, value
-- **delete_element**: Remove element
-  - Params: element_id
-
-## Units & Profiles:
-- All dimensions in **millimeters (mm)**
-- Profiles: "UB 305x165x40", "UB 406x178x54", "UC 203x203x46", "UC 254x254x73", "SHS 100x100x5", "RHS 200x100x6", "CHS 168.3x7.1", "PFC 200x90x30"
-- Materials: "S355" (steel), "C30/37" (concrete)
-
-## User Request:
-{user_prompt}
-
-Analyze the request and any provided files. If the user wants to create a structural model, output the appropriate schmekla-command blocks. Explain what you're creating.
-"""
-        return system_prompt
+        return "".join([
+            _PROMPT_INTRO, context, "\n", file_context,
+            _PROMPT_COMMANDS, user_prompt, _PROMPT_OUTRO,
+        ])
 
     def _build_context(self) -> str:
         """Build context string describing current model."""
@@ -230,14 +336,14 @@ Analyze the request and any provided files. If the user wants to create a struct
 
         # Elements by type
         for elem_type in ElementType:
-            elements = self.model.get_elements_by_type(elem_type)
-            if elements:
-                parts.append(f"\n{elem_type.value.title()}s ({len(elements)}):")
-                for elem in elements[:5]:
+            count = self.model.count_by_type(elem_type)
+            if count:
+                parts.append(f"\n{elem_type.value.title()}s ({count}):")
+                for elem in self.model.get_elements_by_type(elem_type, limit=5):
                     desc = self._describe_element(elem)
-                    parts.append(f"  - {elem.name or str(elem.id)[:8]}: {desc}")
-                if len(elements) > 5:
-                    parts.append(f"  ... and {len(elements) - 5} more")
+                    parts.append(f"  - {elem.name or elem.short_id}: {desc}")
+                if count > 5:
+                    parts.append(f"  ... and {count - 5} more")
 
         # Selected elements
         selected = self.model.get_selected_ids()
@@ -297,24 +403,42 @@ Analyze the request and any provided files. If the user wants to create a struct
 
         return None
 
-    def _call_claude_cli(self, prompt: str) -> str:
+    def _get_claude_cli(self) -> Optional[str]:
+        """Return the Claude CLI path, searching only until it has been found once."""
+        if self._claude_exe is None:
+            self._claude_exe = self._find_claude_cli()
+        return self._claude_exe
+
+    def invalidate_cli_cache(self):
+        """Forget the cached Claude CLI path so the next call searches again."""
+        self._claude_exe = None
+
+    def _call_claude_cli(
+        self, prompt: str, on_command: Optional[Callable[[Dict], None]] = None
+    ) -> str:
         """
         Call Claude Code CLI and return response.
 
+        Output is read line by line as the CLI writes it. When on_command is
+        given, each schmekla-command block is extracted and handed to it as
+        soon as its closing fence arrives, before the CLI has finished.
+
         Args:
             prompt: Full prompt to send
+            on_command: Optional callback for each complete command
 
         Returns:
             Response text
         """
         # Find claude CLI
-        claude_exe = self._find_claude_cli()
+        claude_exe = self._get_claude_cli()
         if not claude_exe:
             logger.error("Claude CLI not found in PATH or common locations")
             return "Error: Claude Code CLI not found. Please install it with: npm install -g @anthropic-ai/claude-code"
 
-        logger.debug(f"Using Claude CLI at: {claude_exe}")
+        logger.debug("Using Claude CLI at: {}", claude_exe)
 
+        applied: List[str] = []  # Names of streamed commands already run on the model
         try:
             # Use --print flag with prompt via stdin for non-interactive mode
             # This avoids file permission issues and works with long prompts
@@ -322,34 +446,93 @@ Analyze the request and any provided files. If the user wants to create a struct
 
             logger.debug(f"Running Claude CLI in print mode")
 
-            # Pass prompt via stdin to avoid command line length limits
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
-                input=prompt,
-                capture_output=True,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=180,  # 3 minutes for complex prompts
                 encoding='utf-8'
             )
 
-            if result.returncode != 0:
-                logger.warning(f"Claude CLI returned non-zero: {result.stderr}")
+            # Drain stderr on a side thread so a chatty CLI cannot block stdout
+            stderr_lines: List[str] = []
+            stderr_reader = threading.Thread(
+                target=lambda: stderr_lines.extend(proc.stderr), daemon=True
+            )
+            stderr_reader.start()
+
+            # Enforce the timeout by killing the CLI (select() does not work on Windows pipes)
+            timed_out = threading.Event()
+
+            def _kill():
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(_CLI_TIMEOUT, _kill)
+            timer.start()
+
+            output: List[str] = []
+            block: Optional[List[str]] = None  # Lines of the command block being received
+            try:
+                # Pass prompt via stdin to avoid command line length limits
+                proc.stdin.write(prompt)
+                proc.stdin.close()
+
+                for line in proc.stdout:
+                    output.append(line)
+                    if on_command is None:
+                        continue
+
+                    if block is None:
+                        fence = line.find(_COMMAND_FENCE)
+                        if fence == -1:
+                            continue
+                        block = [line[fence:]]
+                        # Opening and closing fence on the same line
+                        if "```" not in block[0][len(_COMMAND_FENCE):]:
+                            continue
+                    else:
+                        block.append(line)
+                        if not line.lstrip().startswith("```"):
+                            continue
+
+                    for command in self._extract_commands("".join(block)):
+                        on_command(command)
+                        applied.append(command.get("command", "?"))
+                    block = None
+
+                proc.wait()
+            finally:
+                timer.cancel()
+                stderr_reader.join()
+
+            if timed_out.is_set():
+                logger.error("Claude CLI timed out")
+                return f"Error: Claude request timed out after {_CLI_TIMEOUT} seconds" + _applied_note(applied)
+
+            stdout = "".join(output)
+            stderr = "".join(stderr_lines)
+
+            response = stdout or stderr or "No response from Claude"
+            if proc.returncode != 0:
+                logger.warning(f"Claude CLI returned non-zero: {stderr}")
+                # Streamed commands are not rolled back; say which ones took effect
+                note = _applied_note(applied)
                 # Check for common error patterns
-                if "permission" in result.stderr.lower():
-                    return "Error: Claude CLI permission issue. Try running Schmekla from a terminal."
+                if "permission" in stderr.lower():
+                    return "Error: Claude CLI permission issue. Try running Schmekla from a terminal." + note
+                return response + note
 
-            response = result.stdout or result.stderr or "No response from Claude"
             return response
 
         except FileNotFoundError:
             logger.error("Claude CLI not found")
+            self.invalidate_cli_cache()
             return "Error: Claude Code CLI not found. Please install it with: npm install -g @anthropic-ai/claude-code"
-        except subprocess.TimeoutExpired:
-            logger.error("Claude CLI timed out")
-            return "Error: Claude request timed out after 120 seconds"
         except Exception as e:
             logger.error(f"Claude CLI error: {e}")
-            return f"Error: {e}"
+            return f"Error: {e}" + _applied_note(applied)
 
     def _extract_commands(self, response: str) -> List[Dict]:
         """
@@ -362,18 +545,46 @@ Analyze the request and any provided files. If the user wants to create a struct
             List of command dictionaries
         """
         commands = []
-        pattern = r'```schmekla-command\s*(.*?)\s*```'
-        matches = re.findall(pattern, response, re.DOTALL)
-
-        for match in matches:
-            try:
-                cmd = json.loads(match.strip())
-                if "command" in cmd:
+        length = len(response)
+        start = response.find(_COMMAND_FENCE)
+
+        while start != -1:
+            pos = start + len(_COMMAND_FENCE)
+
+            # Fast path: the usual single-object block parsed with orjson
+            if orjson is not None:
+                close = response.find("```", pos)
+                if close != -1:
+                    try:
+                        cmd = orjson.loads(response[pos:close])
+                    except orjson.JSONDecodeError:
+                        pass  # Several objects or a fence inside a string - decode below
+                    else:
+                        if isinstance(cmd, dict) and "command" in cmd:
+                            commands.append(cmd)
+                        start = response.find(_COMMAND_FENCE, close + 3)
+                        continue
+
+            # Decode JSON objects in place until the closing fence
+            while True:
+                while pos < length and response[pos].isspace():
+                    pos += 1
+                if pos >= length or response.startswith("```", pos):
+                    break
+                try:
+                    cmd, pos = _JSON_DECODER.raw_decode(response, pos)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Failed to parse command JSON: {e}")
+                    break
+                if isinstance(cmd, dict) and "command" in cmd:
                     commands.append(cmd)
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse command JSON: {e}")
 
-        logger.debug(f"Extracted {len(commands)} commands from response")
+            close = response.find("```", pos)
+            if close == -1:
+                break
+            start = response.find(_COMMAND_FENCE, close + 3)
+
+        logger.debug("Extracted {} commands from response", len(commands))
         return commands
 
     def _execute_command(self, command: Dict) -> Dict:
@@ -389,42 +600,15 @@ Analyze the request and any provided files. If the user wants to create a struct
         cmd_name = command.get("command")
         params = command.get("params", {})
 
-        logger.info(f"Executing command: {cmd_name}")
-
-        if cmd_name == "create_beam":
-            return self._cmd_create_beam(params)
-        elif cmd_name == "create_curved_beam":
-            return self._cmd_create_curved_beam(params)
-        elif cmd_name == "create_hoop":
-            return self._cmd_create_hoop(params)
-        elif cmd_name == "create_column":
-            return self._cmd_create_column(params)
-        elif cmd_name == "create_plate":
-            return self._cmd_create_plate(params)
-        elif cmd_name == "create_slab":
-            return self._cmd_create_slab(params)
-        elif cmd_name == "create_wall":
-            return self._cmd_create_wall(params)
-        elif cmd_name == "create_footing":
-            return self._cmd_create_footing(params)
-        elif cmd_name == "create_portal_frame":
-            return self._cmd_create_portal_frame(params)
-        elif cmd_name == "create_barrel_canopy":
-            return self._cmd_create_barrel_canopy(params)
-        elif cmd_name == "delete_element":
-            return self._cmd_delete_element(params)
-        elif cmd_name == "modify_element":
-            return self._cmd_modify_element(params)
-        else:
+        logger.info("Executing command: {}", cmd_name)
+
+        handler = self._dispatch.get(cmd_name)
+        if handler is None:
             return {"success": False, "error": f"Unknown command: {cmd_name}"}
+        return handler(params)
 
     def _cmd_create_beam(self, params: Dict) -> Dict:
         """Create beam command."""
-        from src.core.beam import Beam
-        from src.core.profile import Profile
-        from src.core.material import Material
-        from src.geometry.point import Point3D
-
         try:
             start = Point3D(*params["start"])
             end = Point3D(*params["end"])
@@ -440,11 +624,6 @@ Analyze the request and any provided files. If the user wants to create a struct
 
     def _cmd_create_curved_beam(self, params: Dict) -> Dict:
         """Create curved beam/arc command."""
-        from src.core.curved_beam import CurvedBeam
-        from src.core.profile import Profile
-        from src.core.material import Material
-        from src.geometry.point import Point3D
-
         try:
             start = Point3D(*params["start"])
             end = Point3D(*params["end"])
@@ -463,10 +642,6 @@ Analyze the request and any provided files. If the user wants to create a struct
 
     def _cmd_create_hoop(self, params: Dict) -> Dict:
         """Create barrel vault hoop from grid positions."""
-        from src.core.curved_beam import create_barrel_hoop
-        from src.core.profile import Profile
-        from src.geometry.point import Point3D
-
         try:
             grid_start = Point3D(*params["grid_start"])
             grid_end = Point3D(*params["grid_end"])
@@ -484,14 +659,6 @@ Analyze the request and any provided files. If the user wants to create a struct
 
     def _cmd_create_barrel_canopy(self, params: Dict) -> Dict:
         """Create complete barrel vault canopy structure."""
-        from src.core.curved_beam import create_barrel_hoop
-        from src.core.column import Column
-        from src.core.beam import Beam
-        from src.core.footing import Footing
-        from src.core.profile import Profile
-        from src.core.material import Material
-        from src.geometry.point import Point3D
-
         try:
             ox, oy, oz = params.get("origin", [0, 0, 0])
             width = float(params.get("width", 10000))  # Across building
@@ -504,94 +671,90 @@ Analyze the request and any provided files. If the user wants to create a struct
             hoop_profile = Profile.from_name(params.get("hoop_profile", "CHS 168.3x7.1"))
             purlin_profile = Profile.from_name(params.get("purlin_profile", "SHS 100x100x5"))
             material = Material.default_steel()
+            footing_material = Material.default_concrete()
 
-            created_ids = []
+            new_elements = []
 
-            # Calculate bay spacing
+            # Loop-invariant coordinates (heights are measured from the origin level)
             bay_spacing = length / num_bays
-
-            # Create columns and hoops at each bay line
-            for i in range(num_bays + 1):
-                y_pos = oy + i * bay_spacing
-
+            y_positions = [oy + i * bay_spacing for i in range(num_bays + 1)]
+            right_x = ox + width
+            mid_x = ox + width / 2
+            eaves_z = oz + eaves_height
+            apex_z = oz + apex_height
+            footing_z = oz - 500
+
+            # One pass per bay line: columns, hoop and footings, then the purlins
+            # to the next bay line, so each bay's elements are built together
+            for i, y_pos in enumerate(y_positions):
                 # Column at grid B (left side)
-                col_b_base = Point3D(ox, y_pos, oz)
-                col_b_top = Point3D(ox, y_pos, oz + eaves_height)
                 col_b = Column(
-                    start_point=col_b_base,
-                    end_point=col_b_top,
+                    start_point=Point3D(ox, y_pos, oz),
+                    end_point=Point3D(ox, y_pos, eaves_z),
                     profile=col_profile,
                     material=material,
                     name=f"Col-B{i+1}"
                 )
-                self.model.add_element(col_b)
-                created_ids.append(str(col_b.id))
+                new_elements.append(col_b)
 
                 # Column at grid C (right side)
-                col_c_base = Point3D(ox + width, y_pos, oz)
-                col_c_top = Point3D(ox + width, y_pos, oz + eaves_height)
                 col_c = Column(
-                    start_point=col_c_base,
-                    end_point=col_c_top,
+                    start_point=Point3D(right_x, y_pos, oz),
+                    end_point=Point3D(right_x, y_pos, eaves_z),
                     profile=col_profile,
                     material=material,
                     name=f"Col-C{i+1}"
                 )
-                self.model.add_element(col_c)
-                created_ids.append(str(col_c.id))
+                new_elements.append(col_c)
 
                 # Hoop from B to C at this bay line
                 hoop = create_barrel_hoop(
-                    Point3D(ox, y_pos, 0),
-                    Point3D(ox + width, y_pos, 0),
-                    eaves_height,
-                    apex_height,
+                    Point3D(ox, y_pos, oz),
+                    Point3D(right_x, y_pos, oz),
+                    eaves_z,
+                    apex_z,
                     hoop_profile,
                     f"Hoop-{i+1}"
                 )
-                self.model.add_element(hoop)
-                created_ids.append(str(hoop.id))
+                new_elements.append(hoop)
 
                 # Footings under columns
-                footing_b = Footing(Point3D(ox, y_pos, oz - 500), 1200, 1200, 500, name=f"Ftg-B{i+1}")
-                self.model.add_element(footing_b)
-                created_ids.append(str(footing_b.id))
-
-                footing_c = Footing(Point3D(ox + width, y_pos, oz - 500), 1200, 1200, 500, name=f"Ftg-C{i+1}")
-                self.model.add_element(footing_c)
-                created_ids.append(str(footing_c.id))
-
-            # Create purlins between hoops (at eaves and ridge)
-            for i in range(num_bays):
-                y1 = oy + i * bay_spacing
-                y2 = oy + (i + 1) * bay_spacing
-
-                # Eaves purlin at B
-                purlin_b = Beam(
-                    Point3D(ox, y1, eaves_height),
-                    Point3D(ox, y2, eaves_height),
-                    purlin_profile, material, name=f"Purlin-B{i+1}"
-                )
-                self.model.add_element(purlin_b)
-                created_ids.append(str(purlin_b.id))
-
-                # Eaves purlin at C
-                purlin_c = Beam(
-                    Point3D(ox + width, y1, eaves_height),
-                    Point3D(ox + width, y2, eaves_height),
-                    purlin_profile, material, name=f"Purlin-C{i+1}"
-                )
-                self.model.add_element(purlin_c)
-                created_ids.append(str(purlin_c.id))
-
-                # Ridge purlin
-                ridge_purlin = Beam(
-                    Point3D(ox + width/2, y1, apex_height),
-                    Point3D(ox + width/2, y2, apex_height),
-                    purlin_profile, material, name=f"Purlin-Ridge{i+1}"
-                )
-                self.model.add_element(ridge_purlin)
-                created_ids.append(str(ridge_purlin.id))
+                footing_b = Footing(Point3D(ox, y_pos, footing_z), 1200, 1200, 500, footing_material, name=f"Ftg-B{i+1}")
+                new_elements.append(footing_b)
+
+                footing_c = Footing(Point3D(right_x, y_pos, footing_z), 1200, 1200, 500, footing_material, name=f"Ftg-C{i+1}")
+                new_elements.append(footing_c)
+
+                # Purlins from this bay line to the next (at eaves and ridge)
+                if i < num_bays:
+                    y1 = y_pos
+                    y2 = y_positions[i + 1]
+
+                    # Eaves purlin at B
+                    purlin_b = Beam(
+                        Point3D(ox, y1, eaves_z),
+                        Point3D(ox, y2, eaves_z),
+                        purlin_profile, material, name=f"Purlin-B{i+1}"
+                    )
+                    new_elements.append(purlin_b)
+
+                    # Eaves purlin at C
+                    purlin_c = Beam(
+                        Point3D(right_x, y1, eaves_z),
+                        Point3D(right_x, y2, eaves_z),
+                        purlin_profile, material, name=f"Purlin-C{i+1}"
+                    )
+                    new_elements.append(purlin_c)
+
+                    # Ridge purlin
+                    ridge_purlin = Beam(
+                        Point3D(mid_x, y1, apex_z),
+                        Point3D(mid_x, y2, apex_z),
+                        purlin_profile, material, name=f"Purlin-Ridge{i+1}"
+                    )
+                    new_elements.append(ridge_purlin)
+
+            created_ids = [str(eid) for eid in self.model.add_elements(new_elements)]
 
             return {
                 "success": True,
@@ -603,11 +766,6 @@ Analyze the request and any provided files. If the user wants to create a struct
 
     def _cmd_create_column(self, params: Dict) -> Dict:
         """Create column command."""
-        from src.core.column import Column
-        from src.core.profile import Profile
-        from src.core.material import Material
-        from src.geometry.point import Point3D
-
         try:
             base = Point3D(*params["base"])
             height = float(params["height"])
@@ -634,10 +792,6 @@ Analyze the request and any provided files. If the user wants to create a struct
 
     def _cmd_create_plate(self, params: Dict) -> Dict:
         """Create plate command."""
-        from src.core.plate import Plate
-        from src.core.material import Material
-        from src.geometry.point import Point3D
-
         try:
             # Points can be list of [x,y,z] or use origin/width/length
             if "points" in params:
@@ -667,10 +821,6 @@ Analyze the request and any provided files. If the user wants to create a struct
 
     def _cmd_create_slab(self, params: Dict) -> Dict:
         """Create slab command."""
-        from src.core.slab import Slab
-        from src.core.material import Material
-        from src.geometry.point import Point3D
-
         try:
             if "points" in params:
                 points = [Point3D(*p) for p in params["points"]]
@@ -699,10 +849,6 @@ Analyze the request and any provided files. If the user wants to create a struct
 
     def _cmd_create_wall(self, params: Dict) -> Dict:
         """Create wall command."""
-        from src.core.wall import Wall
-        from src.core.material import Material
-        from src.geometry.point import Point3D
-
         try:
             start = Point3D(*params["start"])
             end = Point3D(*params["end"])
@@ -721,10 +867,6 @@ Analyze the request and any provided files. If the user wants to create a struct
 
     def _cmd_create_footing(self, params: Dict) -> Dict:
         """Create footing command."""
-        from src.core.footing import Footing
-        from src.core.material import Material
-        from src.geometry.point import Point3D
-
         try:
             center = Point3D(*params["center"])
             width = float(params.get("width", 1500))
@@ -743,12 +885,6 @@ Analyze the request and any provided files. If the user wants to create a struct
 
     def _cmd_create_portal_frame(self, params: Dict) -> Dict:
         """Create portal frame command."""
-        from src.core.beam import Beam
-        from src.core.column import Column
-        from src.core.profile import Profile
-        from src.core.material import Material
-        from src.geometry.point import Point3D
-
         try:
             width = params.get("width", 12000)
             height = params.get("height", 6000)
@@ -796,9 +932,8 @@ Analyze the request and any provided files. If the user wants to create a struct
 
     def _cmd_delete_element(self, params: Dict) -> Dict:
         """Delete element command."""
-        from uuid import UUID
         try:
-            elem_id = UUID(params["element_id"])
+            elem_id = _to_uuid(params["element_id"])
             success = self.model.remove_element(elem_id)
             return {"success": success}
         except Exception as e:
@@ -806,9 +941,8 @@ Analyze the request and any provided files. If the user wants to create a struct
 
     def _cmd_modify_element(self, params: Dict) -> Dict:
         """Modify element command."""
-        from uuid import UUID
         try:
-            elem_id = UUID(params["element_id"])
+            elem_id = _to_uuid(params["element_id"])
             element = self.model.get_element(elem_id)
             if element:
                 prop = params["property"]
@@ -827,6 +961,3 @@ Analyze the request and any provided files. If the user wants to create a struct
             "role": role,
             "content": content
         })
-        # Trim history
-        while len(self.conversation_history) > self.max_history:
-            self.conversation_history.pop(0)
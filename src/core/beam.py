@@ -4,7 +4,9 @@ Beam structural element for Schmekla.
 Represents a linear structural member (beam, girder, etc.).
 """
 
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+import math
+from functools import lru_cache
 from loguru import logger
 
 from src.core.element import StructuralElement, ElementType, EndPointOffsets, LocalCoordinateSystem
@@ -17,6 +19,52 @@ if TYPE_CHECKING:
     from src.ifc.exporter import IFCExporter
 
 
+def _direction_and_vertical(start: Point3D, end: Point3D) -> Tuple[Vector3D, bool]:
+    """
+    Unit direction from start to end, and whether it is nearly vertical.
+
+    The vertical test |dz| / L > 0.99 is done on squared values of the raw
+    delta, so it needs no normalized vector.
+    """
+    dx, dy, dz = end.x - start.x, end.y - start.y, end.z - start.z
+    length_sq = dx * dx + dy * dy + dz * dz
+    if length_sq < 1e-20:
+        return Vector3D.zero(), False
+    inv = 1.0 / math.sqrt(length_sq)
+    return Vector3D(dx * inv, dy * inv, dz * inv), dz * dz > 0.9801 * length_sq
+
+
+@lru_cache(maxsize=256)
+def _beam_section_solid(width: float, height: float, length: float) -> Any:
+    """
+    Extrude a width x height rectangle by length from the origin.
+
+    Cached per section size and length (repeated framing shares these). The
+    cached shape is a template only: it is never handed out, so meshing or
+    cleaning an element's solid cannot touch it.
+    """
+    import cadquery as cq
+
+    # Using CadQuery for simplicity
+    result = (
+        cq.Workplane("XY")
+        .rect(width, height)
+        .extrude(length)
+    )
+    return result.val().wrapped
+
+
+def _build_beam_solid(x: float, y: float, z: float, width: float, height: float, length: float) -> Any:
+    """Extrude a width x height rectangle by length from (x, y, z)."""
+    from OCP.BRepBuilderAPI import BRepBuilderAPI_Transform
+    from OCP.gp import gp_Trsf, gp_Vec
+
+    # Independent copy of the cached template, translated into place
+    placement = gp_Trsf()
+    placement.SetTranslation(gp_Vec(x, y, z))
+    return BRepBuilderAPI_Transform(_beam_section_solid(width, height, length), placement, True).Shape()
+
+
 class Beam(StructuralElement):
     """
     Structural beam element.
@@ -46,6 +94,11 @@ class Beam(StructuralElement):
         """
         super().__init__()
 
+        # Derived geometry (length, direction, coordinate systems), cleared on any change
+        self._cache: Dict[Any, Any] = {}
+        # (inputs, formatted properties) from the last properties query
+        self._props_cache: Optional[Tuple[tuple, Dict[str, Any]]] = None
+
         self.start_point = start_point
         self.end_point = end_point
         self._profile = profile or Profile.from_name("UB 305x165x40")
@@ -62,26 +115,77 @@ class Beam(StructuralElement):
         self.start_connection: str = ""
         self.end_connection: str = ""
 
-        logger.debug(f"Created Beam from {start_point} to {end_point}")
+        logger.debug("Created Beam from {} to {}", start_point, end_point)
 
     @property
     def element_type(self) -> ElementType:
         return ElementType.BEAM
 
+    @property
+    def start_point(self) -> Point3D:
+        """Beam start point."""
+        return self._start_point
+
+    @start_point.setter
+    def start_point(self, value: Point3D):
+        self._start_point = value
+        self._cache.clear()
+
+    @property
+    def end_point(self) -> Point3D:
+        """Beam end point."""
+        return self._end_point
+
+    @end_point.setter
+    def end_point(self, value: Point3D):
+        self._end_point = value
+        self._cache.clear()
+
+    @property
+    def rotation(self) -> float:
+        """Rotation around beam axis in degrees."""
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value: float):
+        self._rotation = value
+        self._cache.clear()
+
+    def invalidate(self):
+        """Mark element as needing geometry regeneration."""
+        super().invalidate()
+        self._cache.clear()
+
     @property
     def length(self) -> float:
         """Beam length in mm."""
-        return self.start_point.distance_to(self.end_point)
+        length = self._cache.get("length")
+        if length is None:
+            length = self.start_point.distance_to(self.end_point)
+            self._cache["length"] = length
+        return length
 
     @property
     def direction(self) -> Vector3D:
         """Unit direction vector from start to end."""
-        return (self.end_point - self.start_point).normalize()
+        return self._direction_and_vertical()[0]
+
+    def _direction_and_vertical(self) -> Tuple[Vector3D, bool]:
+        """Cached unit direction and nearly-vertical flag."""
+        result = self._cache.get("direction")
+        if result is None:
+            result = _direction_and_vertical(self.start_point, self.end_point)
+            self._cache["direction"] = result
+        return result
 
     @property
     def midpoint(self) -> Point3D:
         """Beam midpoint."""
-        return self.start_point.midpoint_to(self.end_point)
+        midpoint = self._cache.get("midpoint")
+        if midpoint is None:
+            midpoint = self.start_point.midpoint_to(self.end_point)
+            self._cache["midpoint"] = midpoint
+        return midpoint
 
     @property
     def start_offsets(self) -> EndPointOffsets:
@@ -117,26 +221,39 @@ class Beam(StructuralElement):
 
         Returns:
             LocalCoordinateSystem with origin, x_axis, y_axis, z_axis
+            (cached until the beam changes - treat as read-only)
         """
+        local_cs = self._cache.get(at_start)
+        if local_cs is None:
+            local_cs = self._compute_local_coordinate_system(at_start)
+            self._cache[at_start] = local_cs
+        return local_cs
+
+    def _compute_local_coordinate_system(self, at_start: bool) -> LocalCoordinateSystem:
+        """Build the local coordinate system (uncached)."""
         # X-axis is along the beam
-        x_axis = self.direction
-        world_z = Vector3D.unit_z()
+        x_axis, vertical = self._direction_and_vertical()
 
         # Calculate local Y axis (typically "up" relative to beam)
-        if abs(x_axis.dot(world_z)) > 0.99:
+        if vertical:
             # Beam is nearly vertical, use X as reference
             y_axis = Vector3D.unit_x().cross(x_axis).normalize()
         else:
             # Use world Z to define "up"
-            y_axis = x_axis.cross(world_z).cross(x_axis).normalize()
+            y_axis = x_axis.cross(Vector3D.unit_z()).cross(x_axis).normalize()
 
         # Z-axis completes the right-hand system
         z_axis = x_axis.cross(y_axis).normalize()
 
-        # Apply rotation around beam axis
+        # Apply rotation around beam axis. y and z are orthonormal to x, so
+        # Rodrigues' formula reduces to a planar rotation in the y/z plane.
         if self.rotation != 0:
-            y_axis = y_axis.rotate_around_axis(x_axis, self.rotation)
-            z_axis = z_axis.rotate_around_axis(x_axis, self.rotation)
+            angle = math.radians(self.rotation)
+            c, s = math.cos(angle), math.sin(angle)
+            y_axis, z_axis = (
+                Vector3D(y_axis.x * c + z_axis.x * s, y_axis.y * c + z_axis.y * s, y_axis.z * c + z_axis.z * s),
+                Vector3D(z_axis.x * c - y_axis.x * s, z_axis.y * c - y_axis.y * s, z_axis.z * c - y_axis.z * s),
+            )
 
         origin = self.start_point if at_start else self.end_point
 
@@ -155,11 +272,12 @@ class Beam(StructuralElement):
             Point3D representing the actual start position
         """
         if self._start_offsets.is_zero():
-            return self.start_point.copy()
+            return self.start_point
 
         local_cs = self.get_local_coordinate_system(at_start=True)
-        global_offset = local_cs.transform_offsets_to_global(self._start_offsets)
-        return self.start_point + global_offset
+        dx, dy, dz = local_cs.transform_offsets_to_global_raw(self._start_offsets)
+        point = self.start_point
+        return Point3D(point.x + dx, point.y + dy, point.z + dz)
 
     def get_actual_end_point(self) -> Point3D:
         """
@@ -169,11 +287,12 @@ class Beam(StructuralElement):
             Point3D representing the actual end position
         """
         if self._end_offsets.is_zero():
-            return self.end_point.copy()
+            return self.end_point
 
         local_cs = self.get_local_coordinate_system(at_start=False)
-        global_offset = local_cs.transform_offsets_to_global(self._end_offsets)
-        return self.end_point + global_offset
+        dx, dy, dz = local_cs.transform_offsets_to_global_raw(self._end_offsets)
+        point = self.end_point
+        return Point3D(point.x + dx, point.y + dy, point.z + dz)
 
     def swap_start_end(self):
         """
@@ -191,60 +310,33 @@ class Beam(StructuralElement):
         self.start_connection, self.end_connection = self.end_connection, self.start_connection
 
         self.invalidate()
-        logger.debug(f"Swapped start/end for beam {self._id}")
+        logger.debug("Swapped start/end for beam {}", self._id)
 
     def generate_solid(self) -> Any:
         """
         Generate beam solid by sweeping profile along axis.
 
         Returns:
-            OpenCascade TopoDS_Shape or CadQuery solid
+            OpenCascade TopoDS_Shape or CadQuery solid, or None if the
+            section has no usable outline
         """
         try:
-            import cadquery as cq
-            from OCP.gp import gp_Pnt, gp_Dir, gp_Ax2
+            logger.debug("Generating solid for beam {}", self._id)
 
-            logger.debug(f"Generating solid for beam {self._id}")
+            # A section without a usable outline gives no solid, so the
+            # viewport falls back to its simple representation
+            if self._profile.b <= 0 or self._profile.h <= 0:
+                logger.error(f"Failed to generate beam solid: degenerate section {self._profile.name}")
+                return None
 
-            # Get actual start/end with offsets
+            # Extrusion starts at the actual (offset) start point
             actual_start = self.get_actual_start_point()
-            actual_end = self.get_actual_end_point()
-
-            # Create profile at start point
-            profile_wire = self._create_profile_wire()
-
-            # Determine local coordinate system
-            z_dir = self.direction  # Beam axis
-            world_z = Vector3D.unit_z()
-
-            # Calculate local Y axis (typically "up" relative to beam)
-            if abs(z_dir.dot(world_z)) > 0.99:
-                # Beam is nearly vertical, use X as reference
-                y_dir = Vector3D.unit_x().cross(z_dir).normalize()
-            else:
-                # Use world Z to define "up"
-                y_dir = z_dir.cross(world_z).cross(z_dir).normalize()
-
-            x_dir = y_dir.cross(z_dir).normalize()
-
-            # Apply rotation around beam axis
-            if self.rotation != 0:
-                y_dir = y_dir.rotate_around_axis(z_dir, self.rotation)
-                x_dir = x_dir.rotate_around_axis(z_dir, self.rotation)
-
-            # Create the swept solid
-            # Using CadQuery for simplicity
-            result = (
-                cq.Workplane("XY")
-                .transformed(
-                    offset=(actual_start.x, actual_start.y, actual_start.z),
-                    rotate=(0, 0, 0)  # TODO: proper rotation
-                )
-                .rect(self._profile.b, self._profile.h)
-                .extrude(self.length)
-            )
 
-            return result.val().wrapped
+            # Create the swept solid (kept per beam in _solid until invalidated)
+            return _build_beam_solid(
+                actual_start.x, actual_start.y, actual_start.z,
+                self._profile.b, self._profile.h, self.length
+            )
 
         except ImportError as e:
             logger.error(f"CadQuery/OCC not available: {e}")
@@ -288,7 +380,20 @@ class Beam(StructuralElement):
         return create_ifc_beam(self, exporter)
 
     def _get_specific_properties(self) -> Dict[str, Any]:
-        """Get beam-specific properties."""
+        """Get beam-specific properties (reformatted only when their inputs change)."""
+        start, end = self.start_point, self.end_point
+        so, eo = self._start_offsets, self._end_offsets
+        key = (
+            start.x, start.y, start.z, end.x, end.y, end.z, self.rotation, self.camber,
+            so.dx, so.dy, so.dz, eo.dx, eo.dy, eo.dz,
+        )
+        cached = self._props_cache
+        if cached is None or cached[0] != key:
+            cached = self._props_cache = (key, self._format_properties())
+        return cached[1]
+
+    def _format_properties(self) -> Dict[str, Any]:
+        """Format the beam-specific display properties."""
         return {
             "Length": f"{self.length:.1f} mm",
             "Start Point": str(self.start_point),
@@ -381,15 +486,15 @@ class Beam(StructuralElement):
             Tuple of two new Beam objects
         """
         beam1 = Beam(
-            self.start_point.copy(),
-            point.copy(),
+            self.start_point,
+            point,
             self._profile,
             self._material,
             self.rotation
         )
         beam2 = Beam(
-            point.copy(),
-            self.end_point.copy(),
+            point,
+            self.end_point,
             self._profile,
             self._material,
             self.rotation
@@ -437,8 +542,8 @@ class Beam(StructuralElement):
     def copy(self) -> "Beam":
         """Create a copy of this beam."""
         new_beam = Beam(
-            self.start_point.copy(),
-            self.end_point.copy(),
+            self.start_point,
+            self.end_point,
             self._profile,
             self._material,
             self.rotation,
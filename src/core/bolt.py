@@ -4,11 +4,15 @@ Bolt Group implementation.
 Represents a group of bolts connecting parts.
 Mimics Tekla Structures BoltGroup.
 """
-from typing import List, Optional, Tuple
+from typing import List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 from uuid import UUID, uuid4
 import math
 
+import numpy as np
+from loguru import logger
+
 from src.core.element import StructuralElement, ElementType
 from src.geometry.point import Point3D
 from src.geometry.vector import Vector3D
@@ -16,6 +20,70 @@ from src.geometry.transform import Transform
 from src.core.material import Material
 import cadquery as cq
 
+
+@lru_cache(maxsize=2048)
+def _parse_spacing_cached(spacing_str: str) -> Tuple[float, ...]:
+    """
+    Parse a Tekla-style spacing string into individual spacings.
+
+    Spacing strings repeat heavily across a model, so results are cached
+    (tuples are immutable and safe to share between bolt groups).
+    """
+    if not spacing_str:
+        return ()
+
+    spacings = []
+    # Whitespace-separated tokens: "value" or "count*value"; malformed tokens are ignored
+    for part in spacing_str.split():
+        if '*' in part:
+            try:
+                count_str, val_str = part.split('*')
+                count = int(count_str)
+                val = float(val_str)
+                spacings.extend([val] * count)
+            except ValueError:
+                pass
+        else:
+            try:
+                spacings.append(float(part))
+            except ValueError:
+                pass
+    return tuple(spacings)
+
+
+
+@lru_cache(maxsize=256)
+def _local_bolt_grid(spacing_x: str, spacing_y: str) -> np.ndarray:
+    """
+    Local homogeneous bolt coordinates (x, y, 0, 1) for a spacing pattern.
+
+    Everything that depends only on the spacing strings is evaluated here once
+    per pattern; placing a bolt group is then a single matrix product. The
+    returned array is shared and read-only.
+    """
+    # Local bolt coordinates measured from the origin
+    x_coords = np.concatenate(([0.0], np.cumsum(_parse_spacing_cached(spacing_x))))
+    y_coords = np.concatenate(([0.0], np.cumsum(_parse_spacing_cached(spacing_y))))
+
+    # x-row major, matching the original nested loop order
+    xx, yy = np.meshgrid(x_coords, y_coords, indexing='ij')
+    local = np.column_stack((xx.ravel(), yy.ravel(), np.zeros(xx.size), np.ones(xx.size)))
+    local.setflags(write=False)
+    return local
+
+
+class BoltPositions(NamedTuple):
+    """Bolt centre coordinates stored as parallel arrays (one entry per bolt)."""
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+
+    @property
+    def size(self) -> int:
+        """Number of bolts."""
+        return self.x.size
+
+
 @dataclass
 class BoltGroup(StructuralElement):
     """
@@ -49,118 +117,83 @@ class BoltGroup(StructuralElement):
     def hole_diameter(self) -> float:
         return self.bolt_diameter + self.hole_tolerance
 
+    def get_bolt_position_arrays(self) -> BoltPositions:
+        """
+        Calculate global positions of individual bolts as coordinate arrays.
+
+        Returns:
+            BoltPositions with x, y, z arrays (x-row major, like get_bolt_positions)
+        """
+        # Local grid for this spacing pattern (parsed and laid out once per pattern)
+        local = _local_bolt_grid(self.spacing_x, self.spacing_y)
+
+        # P = O + x*Vx + y*Vy as one matrix product (axes normalized by Transform)
+        basis = Transform.from_origin_and_axes(self.origin, self.direction_x, self.direction_y)
+        world = local @ basis.matrix.T
+        return BoltPositions(world[:, 0], world[:, 1], world[:, 2])
+
     def get_bolt_positions(self) -> List[Point3D]:
         """Calculate global positions of individual bolts."""
-        positions = []
-        
-        # Parse spacings
-        dx_list = self._parse_spacing(self.spacing_x)
-        dy_list = self._parse_spacing(self.spacing_y)
-        
-        # Determine start point (usually origin)
-        # In Tekla, bolt group has an origin.
-        
-        current_x = 0.0
-        x_coords = [0.0]
-        for dx in dx_list:
-            current_x += dx
-            x_coords.append(current_x)
-            
-        current_y = 0.0
-        y_coords = [0.0]
-        for dy in dy_list:
-            current_y += dy
-            y_coords.append(current_y)
-            
-        # Create grid of points
-        # Ensure vectors are normalized
-        vx = self.direction_x.normalize()
-        vy = self.direction_y.normalize()
-        
-        for x in x_coords:
-            for y in y_coords:
-                # P = O + x*Vx + y*Vy
-                pos = Point3D(
-                    self.origin.x + x * vx.x + y * vy.x,
-                    self.origin.y + x * vx.y + y * vy.y,
-                    self.origin.z + x * vx.z + y * vy.z
-                )
-                positions.append(pos)
-                
-        return positions
-
-    def _parse_spacing(self, spacing_str: str) -> List[float]:
+        px, py, pz = self.get_bolt_position_arrays()
+        return [Point3D(x, y, z) for x, y, z in zip(px.tolist(), py.tolist(), pz.tolist())]
+
+    def _parse_spacing(self, spacing_str: str) -> Tuple[float, ...]:
         """Parse Tekla-style spacing string (e.g., '100 2*50')."""
-        spacings = []
-        if not spacing_str:
-            return []
-            
-        parts = spacing_str.split()
-        for part in parts:
-            if '*' in part:
-                try:
-                    count_str, val_str = part.split('*')
-                    count = int(count_str)
-                    val = float(val_str)
-                    spacings.extend([val] * count)
-                except ValueError:
-                    pass
-            else:
-                try:
-                    spacings.append(float(part))
-                except ValueError:
-                    pass
-        return spacings
+        return _parse_spacing_cached(spacing_str)
 
     def generate_solid(self):
-        """Generate geometry for the bolts."""
-        # For visualization, we create cylinders for each bolt
-        positions = self.get_bolt_positions()
-        if not positions:
+        """
+        Generate geometry for the bolts.
+
+        A single cylinder is built once and placed at every bolt position by
+        location only, so all bolts share the same underlying geometry.
+
+        Returns:
+            OpenCascade TopoDS_Compound of bolt cylinders, or None
+        """
+        positions = self.get_bolt_position_arrays()
+        if not positions.size:
+            return None
+
+        try:
+            from OCP.gp import gp_Pnt, gp_Dir, gp_Ax2, gp_Trsf, gp_Vec
+            from OCP.BRepPrimAPI import BRepPrimAPI_MakeCylinder
+            from OCP.BRep import BRep_Builder
+            from OCP.TopoDS import TopoDS_Compound
+            from OCP.TopLoc import TopLoc_Location
+
+            # We need a length for the bolts.
+            # Typically determined by part thickness, but for now fixed or estimated.
+            length = 100.0  # Placeholder
+            half = length / 2
+
+            # Direction of bolt is usually Z (normal to XY plane of bolt group)
+            vz = self.direction_x.cross(self.direction_y).normalize()
+
+            # Template bolt centred on the global origin along vz
+            template = BRepPrimAPI_MakeCylinder(
+                gp_Ax2(gp_Pnt(-vz.x * half, -vz.y * half, -vz.z * half), gp_Dir(vz.x, vz.y, vz.z)),
+                self.bolt_diameter / 2,
+                length
+            ).Shape()
+
+            builder = BRep_Builder()
+            compound = TopoDS_Compound()
+            builder.MakeCompound(compound)
+
+            trsf = gp_Trsf()
+            for px, py, pz in zip(*(axis.tolist() for axis in positions)):
+                trsf.SetTranslation(gp_Vec(px, py, pz))
+                builder.Add(compound, template.Moved(TopLoc_Location(trsf)))
+
+            return compound
+
+        except ImportError as e:
+            logger.error(f"OCC not available: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to generate bolt group solid: {e}")
             return None
-            
-        # We need a length for the bolts. 
-        # Typically determined by part thickness, but for now fixed or estimated.
-        length = 100.0 # Placeholder
-        
-        # Create one bolt cylinder and copy it
-        # Direction of bolt is usually Z (normal to XY plane of bolt group)
-        vz = self.direction_x.cross(self.direction_y).normalize()
-        
-        solids = []
-        for pos in positions:
-            # Create cylinder centered at pos, oriented along vz
-            # CadQuery cylinder is created at origin along Z.
-            
-            # Start point should be slightly offset to center the grip
-            start = Point3D(
-                pos.x - vz.x * (length/2),
-                pos.y - vz.y * (length/2),
-                pos.z - vz.z * (length/2)
-            )
-            
-            # Create cylinder from start to end
-            end = Point3D(
-                pos.x + vz.x * (length/2),
-                pos.y + vz.y * (length/2),
-                pos.z + vz.z * (length/2)
-            )
-            
-            # Use CadQuery
-            # Workplane logic might be needed
-            # Simple approach: Create at origin, rotate/translate
-            
-            # Or use makeCylinder from Workplane
-            # solid = cq.Workplane("XY").cylinder(length, self.bolt_diameter/2)
-            # Transform...
-            
-            # Let's use a simpler representation for now if strictly needed for specific CAD kernel
-            # Assuming we can return a list of shapes or a compound
-            pass
-            
-        # Returning None for now as actual implementation depends on how Model handles compounds
-        # We might need to override get_mesh instead
-        return None
 
     @property
     def element_type(self) -> ElementType:
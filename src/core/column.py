@@ -4,11 +4,13 @@ Column structural element for Schmekla.
 Represents a vertical structural member (column, post, pier).
 """
 
-from typing import Optional, Dict, Any, TYPE_CHECKING
+import math
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING
 from loguru import logger
 
 from src.core.element import StructuralElement, ElementType, EndPointOffsets, LocalCoordinateSystem
-from src.core.profile import Profile
+from src.core.profile import Profile, ProfileType
 from src.core.material import Material
 from src.geometry.point import Point3D
 from src.geometry.vector import Vector3D
@@ -17,6 +19,138 @@ if TYPE_CHECKING:
     from src.ifc.exporter import IFCExporter
 
 
+def _cross(a: Tuple[float, float, float], b: Tuple[float, float, float]) -> Tuple[float, float, float]:
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def _unit(v: Tuple[float, float, float]) -> Tuple[float, float, float]:
+    length = math.sqrt(v[0] * v[0] + v[1] * v[1] + v[2] * v[2])
+    if length < 1e-10:
+        return (0.0, 0.0, 0.0)
+    return (v[0] / length, v[1] / length, v[2] / length)
+
+
+def _local_basis(
+    sx: float, sy: float, sz: float,
+    ex: float, ey: float, ez: float,
+    cos_r: float = 1.0, sin_r: float = 0.0
+) -> Tuple[Tuple[float, float, float], ...]:
+    """
+    Local axes of a linear member as plain float tuples.
+
+    Same construction as Column.get_local_coordinate_system, kept free of
+    Vector3D temporaries; results are wrapped only at the boundary. The
+    rotation about the member axis is passed as its cosine and sine.
+
+    Returns:
+        (x_axis, y_axis, z_axis)
+    """
+    # X-axis is along the column
+    x_axis = _unit((ex - sx, ey - sy, ez - sz))
+
+    # Local Y axis: world X (or -world Y when the column runs along X) made
+    # orthogonal to x by Gram-Schmidt, equal to the former double cross product
+    xx, xy, xz = x_axis
+    if abs(xx) > 0.99:
+        y_axis = _unit((xy * xx, xy * xy - 1.0, xy * xz))
+    else:
+        y_axis = _unit((1.0 - xx * xx, -xx * xy, -xx * xz))
+
+    # Z-axis completes the right-hand system (unit, as x and y are orthonormal)
+    z_axis = _cross(x_axis, y_axis)
+
+    # Rotation around the column axis: y and z are orthonormal to x, so
+    # Rodrigues' formula reduces to a planar rotation in the y/z plane
+    if sin_r != 0 or cos_r != 1:
+        c, s = cos_r, sin_r
+        y_axis, z_axis = (
+            (y_axis[0] * c + z_axis[0] * s, y_axis[1] * c + z_axis[1] * s, y_axis[2] * c + z_axis[2] * s),
+            (z_axis[0] * c - y_axis[0] * s, z_axis[1] * c - y_axis[1] * s, z_axis[2] * c - y_axis[2] * s),
+        )
+
+    return x_axis, y_axis, z_axis
+
+
+@lru_cache(maxsize=4096)
+def _height_key(rounded_height: float) -> str:
+    """Geometry key for a rounded height; heights cluster, so keys are reused."""
+    return f"H{rounded_height:.0f}"
+
+
+@lru_cache(maxsize=1)
+def _default_profile() -> Profile:
+    """Default column section, looked up once and shared by all columns."""
+    return Profile.from_name("UC 203x203x46")
+
+
+@lru_cache(maxsize=1)
+def _default_material() -> Material:
+    """Default column material, created once and shared by all columns."""
+    return Material.default_steel()
+
+
+class _ZeroOffsets(EndPointOffsets):
+    """Read-only zero offsets, shared by every column until it is given an offset."""
+
+    __slots__ = ()
+
+    def __init__(self):
+        for name in ("dx", "dy", "dz"):
+            object.__setattr__(self, name, 0.0)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("Shared zero offsets are read-only; use copy()")
+
+    def __reduce__(self):
+        # Copies and pickles resolve back to the module-level singleton
+        return "_ZERO_OFFSETS"
+
+
+_ZERO_OFFSETS = _ZeroOffsets()
+
+
+# Section outline codes used when extruding column solids
+_SECTION_RECT = 0      # b x h rectangle (I-sections simplified, SHS/RHS)
+_SECTION_CIRCLE = 1    # diameter d (CHS, solid round)
+_SECTION_DEFAULT = 2   # rectangle with 200mm fallbacks
+_SECTION_CODES = {
+    ProfileType.I_SECTION: _SECTION_RECT,
+    ProfileType.SQUARE_HOLLOW: _SECTION_RECT,
+    ProfileType.RECTANGULAR_HOLLOW: _SECTION_RECT,
+    ProfileType.CIRCULAR_HOLLOW: _SECTION_CIRCLE,
+    ProfileType.CIRCULAR_SOLID: _SECTION_CIRCLE,
+}
+
+# Outline builders indexed by section code: (workplane, b, h, d) -> workplane
+_SECTION_BUILDERS = (
+    lambda wp, b, h, d: wp.rect(b, h),
+    lambda wp, b, h, d: wp.circle(d / 2),
+    lambda wp, b, h, d: wp.rect(b or 200, h or 200),
+)
+
+
+def _extrude_column_section(
+    x: float, y: float, z: float, height: float,
+    section: int, b: float, h: float, d: float, rotation: float
+) -> Any:
+    """Extrude a column section upwards from (x, y, z) and return the OCC shape."""
+    import cadquery as cq
+
+    # Create profile at base and extrude
+    # Start workplane at actual start point, then move to its XY
+    wp = cq.Workplane("XY").workplane(offset=z).center(x, y)
+
+    # Create profile based on type
+    wp = _SECTION_BUILDERS[section](wp, b, h, d)
+
+    # Apply rotation around column axis
+    if rotation != 0:
+        wp = wp.rotate((0, 0, 0), (0, 0, 1), rotation)
+
+    # Extrude
+    return wp.extrude(height).val().wrapped
+
+
 class Column(StructuralElement):
     """
     Structural column element.
@@ -46,26 +180,79 @@ class Column(StructuralElement):
         """
         super().__init__()
 
+        # Derived geometry (height, direction, coordinate systems), cleared on any change
+        self._cache: Dict[Any, Any] = {}
+        # (inputs, formatted properties) from the last properties query
+        self._props_cache: Optional[Tuple[tuple, Dict[str, Any]]] = None
+
         self.start_point = start_point
         self.end_point = end_point
-        self._profile = profile or Profile.from_name("UC 203x203x46")
-        self._material = material or Material.default_steel()
+        self._profile = profile or _default_profile()
+        self._material = material or _default_material()
         self.rotation = rotation
         self._name = name
 
         # Note: height is now a computed property - no assignment needed
 
         # Column-specific properties - local coordinate offsets
-        self._start_offsets = EndPointOffsets()  # Offset at start/base in local coordinates
-        self._end_offsets = EndPointOffsets()    # Offset at end/top in local coordinates
+        # Both ends share the zero sentinel until an offset is written (copy-on-write)
+        self._start_offsets: EndPointOffsets = _ZERO_OFFSETS  # Offset at start/base in local coordinates
+        self._end_offsets: EndPointOffsets = _ZERO_OFFSETS    # Offset at end/top in local coordinates
         self.splice_location: Optional[float] = None  # Height of splice if any
 
-        logger.debug(f"Created Column from {start_point} to {end_point} (h={self.height:.1f}mm)")
+        # Lazy: the height (and the point formatting) is only evaluated if debug logging is on
+        logger.opt(lazy=True).debug(
+            "Created Column from {} to {} (h={:.1f}mm)",
+            lambda: start_point, lambda: end_point, lambda: self.height
+        )
+
+    @property
+    def start_point(self) -> Point3D:
+        """Column start point (bottom/base)."""
+        return self._start_point
+
+    @start_point.setter
+    def start_point(self, value: Point3D):
+        self._start_point = value
+        self._cache.clear()
+
+    @property
+    def end_point(self) -> Point3D:
+        """Column end point (top)."""
+        return self._end_point
+
+    @end_point.setter
+    def end_point(self, value: Point3D):
+        self._end_point = value
+        self._cache.clear()
+
+    @property
+    def rotation(self) -> float:
+        """Rotation around column axis in degrees."""
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value: float):
+        self._rotation = value
+        # Trig of the rotation is needed by every axis rebuild; evaluate it once here
+        rotation_rad = math.radians(value)
+        self._cos_rot = math.cos(rotation_rad)
+        self._sin_rot = math.sin(rotation_rad)
+        self._cache.clear()
+
+    def invalidate(self):
+        """Mark element as needing geometry regeneration."""
+        super().invalidate()
+        self._cache.clear()
 
     @property
     def height(self) -> float:
         """Column height calculated dynamically from start and end points."""
-        return self.start_point.distance_to(self.end_point)
+        height = self._cache.get("height")
+        if height is None:
+            height = self.start_point.distance_to(self.end_point)
+            self._cache["height"] = height
+        return height
 
     @height.setter
     def height(self, value: float):
@@ -83,12 +270,11 @@ class Column(StructuralElement):
 
         # Calculate direction from start to end
         current_direction = self.end_point - self.start_point
-        length = current_direction.length()
+        length_sq = current_direction.length_squared
 
-        if length > 0:
-            # Normalize and scale to new height
-            direction = current_direction.normalize()
-            self.end_point = self.start_point + direction * value
+        if length_sq >= 1e-20:
+            # Normalize and scale to new height in one step (single sqrt)
+            self.end_point = self.start_point + current_direction * (value / math.sqrt(length_sq))
         else:
             # Degenerate case: default to vertical column
             self.end_point = Point3D(
@@ -125,12 +311,17 @@ class Column(StructuralElement):
     @property
     def direction(self) -> Vector3D:
         """Column direction."""
-        return (self.end_point - self.start_point).normalize()
+        direction = self._cache.get("direction")
+        if direction is None:
+            direction = (self.end_point - self.start_point).normalize()
+            self._cache["direction"] = direction
+        return direction
 
     @property
     def start_offsets(self) -> EndPointOffsets:
         """Offset values at start/base point in local coordinates."""
-        return self._start_offsets
+        # Callers may edit the returned offsets in place, so never hand out the sentinel
+        return self._writable_start_offsets()
 
     @start_offsets.setter
     def start_offsets(self, value: EndPointOffsets):
@@ -140,7 +331,7 @@ class Column(StructuralElement):
     @property
     def end_offsets(self) -> EndPointOffsets:
         """Offset values at end/top point in local coordinates."""
-        return self._end_offsets
+        return self._writable_end_offsets()
 
     @end_offsets.setter
     def end_offsets(self, value: EndPointOffsets):
@@ -154,7 +345,7 @@ class Column(StructuralElement):
 
     @base_offset.setter
     def base_offset(self, value: float):
-        self._start_offsets.dx = value
+        self._writable_start_offsets().dx = value
         self.invalidate()
 
     @property
@@ -164,9 +355,21 @@ class Column(StructuralElement):
 
     @top_offset.setter
     def top_offset(self, value: float):
-        self._end_offsets.dx = value
+        self._writable_end_offsets().dx = value
         self.invalidate()
 
+    def _writable_start_offsets(self) -> EndPointOffsets:
+        """Start offsets, detached from the shared zero sentinel before writing."""
+        if self._start_offsets is _ZERO_OFFSETS:
+            self._start_offsets = EndPointOffsets()
+        return self._start_offsets
+
+    def _writable_end_offsets(self) -> EndPointOffsets:
+        """End offsets, detached from the shared zero sentinel before writing."""
+        if self._end_offsets is _ZERO_OFFSETS:
+            self._end_offsets = EndPointOffsets()
+        return self._end_offsets
+
     def get_local_coordinate_system(self, at_start: bool = True) -> LocalCoordinateSystem:
         """
         Get the local coordinate system at start or end point.
@@ -181,35 +384,28 @@ class Column(StructuralElement):
 
         Returns:
             LocalCoordinateSystem with origin, x_axis, y_axis, z_axis
+            (cached until the column changes - treat as read-only)
         """
-        # X-axis is along the column
-        x_axis = self.direction
-        world_x = Vector3D.unit_x()
-        world_y = Vector3D.unit_y()
-
-        # Calculate local Y axis
-        if abs(x_axis.dot(world_x)) > 0.99:
-            # Column direction is nearly parallel to X, use Y as reference
-            y_axis = world_y.cross(x_axis).cross(x_axis).normalize()
-        else:
-            # Use world X to define local Y
-            y_axis = x_axis.cross(world_x).cross(x_axis).normalize()
-
-        # Z-axis completes the right-hand system
-        z_axis = x_axis.cross(y_axis).normalize()
-
-        # Apply rotation around column axis
-        if self.rotation != 0:
-            y_axis = y_axis.rotate_around_axis(x_axis, self.rotation)
-            z_axis = z_axis.rotate_around_axis(x_axis, self.rotation)
+        local_cs = self._cache.get(at_start)
+        if local_cs is None:
+            local_cs = self._compute_local_coordinate_system(at_start)
+            self._cache[at_start] = local_cs
+        return local_cs
+
+    def _compute_local_coordinate_system(self, at_start: bool) -> LocalCoordinateSystem:
+        """Build the local coordinate system (uncached)."""
+        start, end = self.start_point, self.end_point
+        x_axis, y_axis, z_axis = _local_basis(
+            start.x, start.y, start.z, end.x, end.y, end.z, self._cos_rot, self._sin_rot
+        )
 
         origin = self.start_point if at_start else self.end_point
 
         return LocalCoordinateSystem(
             origin=origin,
-            x_axis=x_axis,
-            y_axis=y_axis,
-            z_axis=z_axis
+            x_axis=Vector3D(*x_axis),
+            y_axis=Vector3D(*y_axis),
+            z_axis=Vector3D(*z_axis)
         )
 
     def get_actual_start_point(self) -> Point3D:
@@ -222,9 +418,15 @@ class Column(StructuralElement):
         if self._start_offsets.is_zero():
             return self.start_point.copy()
 
+        offsets = self._start_offsets
+        if offsets.dy == 0 and offsets.dz == 0:
+            # Pure axial shift: only the column direction is needed
+            return self.start_point + self.direction * offsets.dx
+
         local_cs = self.get_local_coordinate_system(at_start=True)
-        global_offset = local_cs.transform_offsets_to_global(self._start_offsets)
-        return self.start_point + global_offset
+        dx, dy, dz = local_cs.transform_offsets_to_global_raw(offsets)
+        point = self.start_point
+        return Point3D(point.x + dx, point.y + dy, point.z + dz)
 
     def get_actual_end_point(self) -> Point3D:
         """
@@ -236,9 +438,15 @@ class Column(StructuralElement):
         if self._end_offsets.is_zero():
             return self.end_point.copy()
 
+        offsets = self._end_offsets
+        if offsets.dy == 0 and offsets.dz == 0:
+            # Pure axial shift: only the column direction is needed
+            return self.end_point + self.direction * offsets.dx
+
         local_cs = self.get_local_coordinate_system(at_start=False)
-        global_offset = local_cs.transform_offsets_to_global(self._end_offsets)
-        return self.end_point + global_offset
+        dx, dy, dz = local_cs.transform_offsets_to_global_raw(offsets)
+        point = self.end_point
+        return Point3D(point.x + dx, point.y + dy, point.z + dz)
 
     def swap_start_end(self):
         """
@@ -253,7 +461,7 @@ class Column(StructuralElement):
         self._start_offsets, self._end_offsets = self._end_offsets, self._start_offsets
 
         self.invalidate()
-        logger.debug(f"Swapped start/end for column {self._id}")
+        logger.debug("Swapped start/end for column {}", self._id)
 
     @property
     def actual_height(self) -> float:
@@ -268,9 +476,7 @@ class Column(StructuralElement):
             OpenCascade TopoDS_Shape or CadQuery solid
         """
         try:
-            import cadquery as cq
-
-            logger.debug(f"Generating solid for column {self._id}")
+            logger.debug("Generating solid for column {}", self._id)
 
             # Get actual start/end points with offsets applied
             actual_start = self.get_actual_start_point()
@@ -281,32 +487,11 @@ class Column(StructuralElement):
                 logger.warning(f"Column {self._id} has non-positive height")
                 return None
 
-            # Create profile at base and extrude
-            # Start workplane at actual start point
-            wp = cq.Workplane("XY").workplane(offset=actual_start.z)
-
-            # Move to actual start point XY
-            wp = wp.center(actual_start.x, actual_start.y)
-
-            # Create profile based on type
-            if self._profile.profile_type.value == "I":
-                # I-section - simplified as rectangle
-                wp = wp.rect(self._profile.b, self._profile.h)
-            elif self._profile.profile_type.value in ("SHS", "RHS"):
-                wp = wp.rect(self._profile.b, self._profile.h)
-            elif self._profile.profile_type.value in ("CHS", "CIRC"):
-                wp = wp.circle(self._profile.d / 2)
-            else:
-                wp = wp.rect(self._profile.b or 200, self._profile.h or 200)
-
-            # Apply rotation around column axis
-            if self.rotation != 0:
-                wp = wp.rotate((0, 0, 0), (0, 0, 1), self.rotation)
-
-            # Extrude
-            result = wp.extrude(actual_height)
-
-            return result.val().wrapped
+            return _extrude_column_section(
+                actual_start.x, actual_start.y, actual_start.z, actual_height,
+                _SECTION_CODES.get(self._profile.profile_type, _SECTION_DEFAULT),
+                self._profile.b, self._profile.h, self._profile.d, self.rotation
+            )
 
         except ImportError as e:
             logger.error(f"CadQuery/OCC not available: {e}")
@@ -349,7 +534,20 @@ class Column(StructuralElement):
         return create_ifc_column(self, exporter)
 
     def _get_specific_properties(self) -> Dict[str, Any]:
-        """Get column-specific properties."""
+        """Get column-specific properties (reformatted only when their inputs change)."""
+        start, end = self.start_point, self.end_point
+        so, eo = self._start_offsets, self._end_offsets
+        key = (
+            start.x, start.y, start.z, end.x, end.y, end.z, self.rotation,
+            so.dx, so.dy, so.dz, eo.dx, eo.dy, eo.dz,
+        )
+        cached = self._props_cache
+        if cached is None or cached[0] != key:
+            cached = self._props_cache = (key, self._format_properties())
+        return cached[1]
+
+    def _format_properties(self) -> Dict[str, Any]:
+        """Format the column-specific display properties."""
         return {
             "Height": f"{self.height:.1f} mm",
             "Base Point": str(self.base_point),
@@ -376,8 +574,7 @@ class Column(StructuralElement):
         Returns:
             Geometry key string like "H4000"
         """
-        rounded_height = round(self.height / tolerance) * tolerance
-        return f"H{rounded_height:.0f}"
+        return _height_key(round(self.height / tolerance) * tolerance)
 
     def _get_rotation_key(self) -> Optional[int]:
         """
@@ -403,27 +600,27 @@ class Column(StructuralElement):
             self.invalidate()
             return True
         elif name == "Start Offset DX":
-            self._start_offsets.dx = float(value)
+            self._writable_start_offsets().dx = float(value)
             self.invalidate()
             return True
         elif name == "Start Offset DY":
-            self._start_offsets.dy = float(value)
+            self._writable_start_offsets().dy = float(value)
             self.invalidate()
             return True
         elif name == "Start Offset DZ":
-            self._start_offsets.dz = float(value)
+            self._writable_start_offsets().dz = float(value)
             self.invalidate()
             return True
         elif name == "End Offset DX":
-            self._end_offsets.dx = float(value)
+            self._writable_end_offsets().dx = float(value)
             self.invalidate()
             return True
         elif name == "End Offset DY":
-            self._end_offsets.dy = float(value)
+            self._writable_end_offsets().dy = float(value)
             self.invalidate()
             return True
         elif name == "End Offset DZ":
-            self._end_offsets.dz = float(value)
+            self._writable_end_offsets().dz = float(value)
             self.invalidate()
             return True
 
@@ -457,10 +654,11 @@ class Column(StructuralElement):
         if split_height <= 0 or split_height >= self.height:
             raise ValueError(f"Split height must be between 0 and {self.height}")
 
-        # Lower column
-        split_point = Point3D(self.base_point.x, self.base_point.y, self.base_point.z + split_height)
+        # Lower column (points are immutable, so both halves can share them)
+        base = self.start_point
+        split_point = Point3D(base.x, base.y, base.z + split_height)
         col1 = Column(
-            self.base_point.copy(),
+            base,
             split_point,
             self._profile,
             self._material,
@@ -469,8 +667,8 @@ class Column(StructuralElement):
 
         # Upper column
         col2 = Column(
-            split_point.copy(),
-            self.end_point.copy(),
+            split_point,
+            self.end_point,
             self._profile,
             self._material,
             self.rotation
@@ -480,23 +678,35 @@ class Column(StructuralElement):
 
     def move(self, vector: Vector3D):
         """Move column by vector."""
+        # A translation leaves height and direction unchanged, so keep them cached
+        cache = self._cache
+        kept = {key: cache[key] for key in ("height", "direction") if key in cache}
         self.start_point = self.start_point + vector
         self.end_point = self.end_point + vector
         self.invalidate()
+        cache.update(kept)
+
+    # Element state kept by copy(); everything else StructuralElement owns is reset
+    _KEPT_ELEMENT_ATTRS = ("_name", "_profile", "_material")
 
     def copy(self) -> "Column":
-        """Create a copy of this column."""
-        new_col = Column(
-            self.start_point.copy(),
-            self.end_point.copy(),
-            self._profile,
-            self._material,
-            self.rotation,
-            self._name
+        """
+        Create a copy of this column.
+
+        Clones without re-running Column.__init__: column attributes are taken
+        from __dict__ (offsets are copied, the zero sentinel is shared), while
+        the ID, geometry caches and other element state start fresh.
+        """
+        new_col = type(self).__new__(type(self))
+        StructuralElement.__init__(new_col)
+        element_state = new_col.__dict__.keys() - set(self._KEPT_ELEMENT_ATTRS)
+        new_col.__dict__.update(
+            {attr: value for attr, value in self.__dict__.items() if attr not in element_state}
         )
-        new_col._start_offsets = self._start_offsets.copy()
-        new_col._end_offsets = self._end_offsets.copy()
-        new_col.splice_location = self.splice_location
+        new_col._cache = {}
+        new_col._props_cache = None
+        new_col._start_offsets = _ZERO_OFFSETS if self._start_offsets is _ZERO_OFFSETS else self._start_offsets.copy()
+        new_col._end_offsets = _ZERO_OFFSETS if self._end_offsets is _ZERO_OFFSETS else self._end_offsets.copy()
         return new_col
 
     def __repr__(self) -> str:
@@ -66,7 +66,7 @@ class CurvedBeam(StructuralElement):
         # Calculate arc geometry
         self._calculate_arc_properties()
 
-        logger.debug(f"Created CurvedBeam from {start_point} to {end_point}, rise={rise}")
+        logger.debug("Created CurvedBeam from {} to {}, rise={}", start_point, end_point, rise)
 
     def _calculate_arc_properties(self):
         """Calculate arc center, radius, and angles."""
@@ -227,7 +227,7 @@ class CurvedBeam(StructuralElement):
             from OCP.GC import GC_MakeArcOfCircle
             from OCP.BRepBuilderAPI import BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeWire
 
-            logger.debug(f"Generating solid for curved beam {self._id}")
+            logger.debug("Generating solid for curved beam {}", self._id)
 
             # Create arc path
             p1 = gp_Pnt(self.start_point.x, self.start_point.y, self.start_point.z)
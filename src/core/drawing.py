@@ -5,9 +5,10 @@ Represents a 2D drawing of the structural model or parts of it.
 """
 from enum import Enum
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from uuid import UUID, uuid4
 from datetime import datetime
+import time
 
 class DrawingType(Enum):
     GENERAL_ARRANGEMENT = "GA"
@@ -33,8 +34,10 @@ class Drawing:
     drawing_type: DrawingType
     
     id: UUID = field(default_factory=uuid4)
-    creation_date: datetime = field(default_factory=datetime.now)
-    modification_date: datetime = field(default_factory=datetime.now)
+    # Dates are accepted here but stored privately: when omitted, only a raw
+    # clock reading is taken and the datetime is built on first read
+    creation_date: InitVar[Optional[datetime]] = None
+    modification_date: InitVar[Optional[datetime]] = None
     status: DrawingStatus = DrawingStatus.UP_TO_DATE
     
     # Elements associated with this drawing
@@ -44,17 +47,57 @@ class Drawing:
     
     # Metadata/User properties
     user_properties: Dict[str, Any] = field(default_factory=dict)
-    
+
+    _created_ns: int = field(default=0, init=False, repr=False)
+    _creation_date: Optional[datetime] = field(default=None, init=False, repr=False)
+    # Raw clock reading of the last change (None once converted or set directly)
+    _modified_ns: Optional[int] = field(default=None, init=False, repr=False)
+    _modification_date: Optional[datetime] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self, creation_date: Optional[datetime], modification_date: Optional[datetime]):
+        if creation_date is None:
+            self._created_ns = time.time_ns()
+        else:
+            self._creation_date = creation_date
+        self._modification_date = modification_date
+
+    def _get_creation_date(self) -> datetime:
+        """Creation time (materialized from the raw clock reading on first read)."""
+        if self._creation_date is None:
+            self._creation_date = datetime.fromtimestamp(self._created_ns / 1e9)
+        return self._creation_date
+
+    def _set_creation_date(self, value: datetime):
+        self._creation_date = value
+
+    def _get_modification_date(self) -> datetime:
+        """Last modification time (falls back to the creation date)."""
+        if self._modified_ns is not None:
+            self._modification_date = datetime.fromtimestamp(self._modified_ns / 1e9)
+            self._modified_ns = None
+        if self._modification_date is None:
+            return self.creation_date
+        return self._modification_date
+
+    def _set_modification_date(self, value: datetime):
+        self._modification_date = value
+        self._modified_ns = None
+
     def mark_as_modified(self):
         """Mark drawing as modified (needs update)."""
         if self.status != DrawingStatus.LOCKED and self.status != DrawingStatus.FROZEN:
             self.status = DrawingStatus.MODIFIED
-            self.modification_date = datetime.now()
-            
+            self._modified_ns = time.time_ns()
+
     def update_status(self, new_status: DrawingStatus):
         """Update drawing status."""
         self.status = new_status
-        self.modification_date = datetime.now()
+        self._modified_ns = time.time_ns()
 
     def __str__(self):
         return f"{self.name} - {self.title} ({self.drawing_type.value})"
+
+
+# Attached after the dataclass is built so the same names can be init arguments
+Drawing.creation_date = property(Drawing._get_creation_date, Drawing._set_creation_date)
+Drawing.modification_date = property(Drawing._get_modification_date, Drawing._set_modification_date)
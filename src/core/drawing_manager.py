@@ -3,7 +3,8 @@ Drawing manager for Schmekla.
 
 Manages creation, deletion, and tracking of drawings.
 """
-from typing import List, Dict, Optional, TYPE_CHECKING
+from collections import defaultdict
+from typing import DefaultDict, List, Dict, Optional, TYPE_CHECKING
 from uuid import UUID
 from loguru import logger
 from datetime import datetime
@@ -21,6 +22,8 @@ class DrawingManager:
     def __init__(self, model: "StructuralModel"):
         self.model = model
         self._drawings: Dict[UUID, Drawing] = {}
+        # Secondary index: drawing type -> {id: drawing}, in creation order
+        self._by_type: DefaultDict[DrawingType, Dict[UUID, Drawing]] = defaultdict(dict)
         
     def create_drawing(self, name: str, title: str, drawing_type: DrawingType, elements: List[UUID] = None) -> Drawing:
         """Create a new drawing."""
@@ -31,13 +34,15 @@ class DrawingManager:
             associated_element_ids=elements or []
         )
         self._drawings[drawing.id] = drawing
+        self._by_type[drawing_type][drawing.id] = drawing
         logger.info(f"Created drawing: {drawing}")
         return drawing
         
     def delete_drawing(self, drawing_id: UUID):
         """Delete a drawing."""
-        if drawing_id in self._drawings:
-            del self._drawings[drawing_id]
+        drawing = self._drawings.pop(drawing_id, None)
+        if drawing is not None:
+            self._by_type[drawing.drawing_type].pop(drawing_id, None)
             logger.info(f"Deleted drawing {drawing_id}")
             
     def get_drawing(self, drawing_id: UUID) -> Optional[Drawing]:
@@ -50,7 +55,8 @@ class DrawingManager:
         
     def get_drawings_by_type(self, drawing_type: DrawingType) -> List[Drawing]:
         """Get drawings of a specific type."""
-        return [d for d in self._drawings.values() if d.drawing_type == drawing_type]
+        bucket = self._by_type.get(drawing_type)
+        return list(bucket.values()) if bucket else []
 
     def create_assembly_drawing(self, main_part_id: UUID) -> Optional[Drawing]:
         """Create an assembly drawing for a part."""
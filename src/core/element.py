@@ -4,19 +4,50 @@ Base structural element class for Schmekla.
 All structural elements (beams, columns, plates, etc.) inherit from this class.
 """
 
+import math
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from uuid import UUID, uuid4
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from uuid import UUID
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 from loguru import logger
 
+from src.geometry.point import Point3D
+from src.geometry.vector import Vector3D
+
 if TYPE_CHECKING:
     from src.core.material import Material
     from src.core.profile import Profile
     from src.core.numbering import ComparisonConfig, PartSignature
-    from src.geometry.point import Point3D
-    from src.geometry.vector import Vector3D
+
+
+# Display meshing tolerances: the linear deflection scales with the shape's
+# bounding box diagonal (OCC's usual 1e-3 ratio) but never drops below 1 mm
+_MIN_LINEAR_DEFLECTION = 1.0
+_RELATIVE_LINEAR_DEFLECTION = 1e-3
+_ANGULAR_DEFLECTION = 0.5
+
+# Element IDs are random (version 4) UUIDs drawn from a pool that is refilled
+# with one os.urandom call, instead of one OS random read per element
+_UUID_POOL_SIZE = 4096
+_uuid_pool: List[UUID] = []
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must not hand out the parent's remaining IDs
+    os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def _next_uuid() -> UUID:
+    """Get a fresh random UUID from the pool."""
+    try:
+        return _uuid_pool.pop()
+    except IndexError:
+        raw = os.urandom(16 * _UUID_POOL_SIZE)
+        batch = [UUID(bytes=raw[i:i + 16], version=4) for i in range(0, len(raw), 16)]
+        uid = batch.pop()
+        _uuid_pool.extend(batch)
+        return uid
 
 
 class ElementType(Enum):
@@ -50,7 +81,7 @@ class PositionAtDepth(Enum):
     BEHIND = "behind"
 
 
-@dataclass
+@dataclass(slots=True)
 class EndPointOffsets:
     """Offset values at element endpoint in local coordinates."""
     dx: float = 0.0  # Along element axis
@@ -76,11 +107,19 @@ class LocalCoordinateSystem:
 
     def transform_offsets_to_global(self, offsets: EndPointOffsets) -> "Vector3D":
         """Convert local offsets to global vector."""
-        from src.geometry.vector import Vector3D
-        return Vector3D(
-            offsets.dx * self.x_axis.x + offsets.dy * self.y_axis.x + offsets.dz * self.z_axis.x,
-            offsets.dx * self.x_axis.y + offsets.dy * self.y_axis.y + offsets.dz * self.z_axis.y,
-            offsets.dx * self.x_axis.z + offsets.dy * self.y_axis.z + offsets.dz * self.z_axis.z
+        return Vector3D(*self.transform_offsets_to_global_raw(offsets))
+
+    def transform_offsets_to_global_raw(self, offsets: EndPointOffsets) -> tuple:
+        """Convert local offsets to a global (x, y, z) tuple, without a Vector3D."""
+        dx, dy, dz = offsets.dx, offsets.dy, offsets.dz
+        if not (dx or dy or dz):
+            # Untrimmed ends are the common case
+            return (0.0, 0.0, 0.0)
+        x, y, z = self.x_axis, self.y_axis, self.z_axis
+        return (
+            dx * x.x + dy * y.x + dz * z.x,
+            dx * x.y + dy * y.y + dz * z.y,
+            dx * x.z + dy * y.z + dz * z.z
         )
 
 
@@ -94,7 +133,8 @@ class StructuralElement(ABC):
 
     def __init__(self):
         """Initialize base element properties."""
-        self._id: UUID = uuid4()
+        self._id: UUID = _next_uuid()
+        self._short_id: Optional[str] = None  # Lazily formatted, see short_id
         self._name: str = ""
         self._material: Optional["Material"] = None
         self._profile: Optional["Profile"] = None
@@ -107,6 +147,7 @@ class StructuralElement(ABC):
         self._solid: Optional[Any] = None  # OpenCascade TopoDS_Shape
         self._mesh: Optional[Any] = None   # PyVista mesh for display
         self._dirty: bool = True           # Needs geometry regeneration
+        self._mesh_deflection: Optional[float] = None  # None = size-adaptive
 
         # Metadata
         self._user_attributes: Dict[str, Any] = {}
@@ -117,13 +158,20 @@ class StructuralElement(ABC):
         self._part_number: str = ""
         self._assembly_number: str = ""
 
-        logger.debug(f"Created {self.__class__.__name__} with ID {self._id}")
+        logger.debug("Created {} with ID {}", self.__class__.__name__, self._id)
 
     @property
     def id(self) -> UUID:
         """Unique identifier for this element."""
         return self._id
 
+    @property
+    def short_id(self) -> str:
+        """First 8 characters of the ID, for labels (formatted once and cached)."""
+        if self._short_id is None:
+            self._short_id = str(self._id)[:8]
+        return self._short_id
+
     @property
     def name(self) -> str:
         """Element name/mark."""
@@ -140,8 +188,8 @@ class StructuralElement(ABC):
 
     @material.setter
     def material(self, value: "Material"):
+        # Solid and mesh do not depend on material, so both are kept
         self._material = value
-        self.invalidate()
 
     @property
     def profile(self) -> Optional["Profile"]:
@@ -208,12 +256,34 @@ class StructuralElement(ABC):
             OpenCascade TopoDS_Shape
         """
         if self._dirty or self._solid is None:
-            logger.debug(f"Regenerating solid for {self._id}")
+            logger.debug("Regenerating solid for {}", self._id)
             self._solid = self.generate_solid()
             self._mesh = None  # Invalidate mesh
             self._dirty = False
         return self._solid
 
+    @property
+    def mesh_deflection(self) -> Optional[float]:
+        """
+        Linear deflection (mm) used to mesh this element for display.
+
+        None picks one from the element's size; set a value to request a
+        coarser or finer mesh.
+        """
+        return self._mesh_deflection
+
+    @mesh_deflection.setter
+    def mesh_deflection(self, value: Optional[float]):
+        self._mesh_deflection = value
+        self._mesh = None
+        if self._solid is not None:
+            # BRepMesh keeps an existing finer triangulation, so drop it first
+            try:
+                from OCP.BRepTools import BRepTools
+                BRepTools.Clean_s(self._solid)
+            except ImportError:
+                self._solid = None
+
     def get_mesh(self) -> Any:
         """
         Get the display mesh, generating from solid if needed.
@@ -238,24 +308,34 @@ class StructuralElement(ABC):
             PyVista mesh
         """
         try:
+            import numpy as np
             import pyvista as pv
             from OCP.BRepMesh import BRepMesh_IncrementalMesh
+            from OCP.Bnd import Bnd_Box
+            from OCP.BRepBndLib import BRepBndLib
             from OCP.TopExp import TopExp_Explorer
             from OCP.TopAbs import TopAbs_FACE
             from OCP.BRep import BRep_Tool
             from OCP.TopLoc import TopLoc_Location
+            from OCP.TopoDS import TopoDS
 
-            # Mesh the shape
-            mesh_algo = BRepMesh_IncrementalMesh(solid, 1.0, False, 0.5, True)
+            # Mesh the shape; triangle count grows with 1/deflection^2, so a
+            # fixed 1 mm tolerance is far finer than large members need
+            linear_deflection = self._mesh_deflection
+            if linear_deflection is None:
+                bbox = Bnd_Box()
+                BRepBndLib.Add_s(solid, bbox)
+                xmin, ymin, zmin, xmax, ymax, zmax = bbox.Get()
+                diagonal = math.hypot(xmax - xmin, ymax - ymin, zmax - zmin)
+                linear_deflection = max(_MIN_LINEAR_DEFLECTION, _RELATIVE_LINEAR_DEFLECTION * diagonal)
+            mesh_algo = BRepMesh_IncrementalMesh(solid, linear_deflection, False, _ANGULAR_DEFLECTION, True)
             mesh_algo.Perform()
 
-            # Extract triangles from faces
-            vertices = []
-            faces = []
+            # Extract triangles from faces into per-face arrays
+            vertex_blocks = []
+            face_blocks = []
             vertex_offset = 0
 
-            from OCP.TopoDS import TopoDS
-
             explorer = TopExp_Explorer(solid, TopAbs_FACE)
             while explorer.More():
                 face = TopoDS.Face_s(explorer.Current())
@@ -263,30 +343,41 @@ class StructuralElement(ABC):
                 triangulation = BRep_Tool.Triangulation_s(face, location)
 
                 if triangulation is not None:
-                    # Get vertices
-                    for i in range(1, triangulation.NbNodes() + 1):
-                        node = triangulation.Node(i)
-                        if not location.IsIdentity():
-                            node = node.Transformed(location.Transformation())
-                        vertices.append([node.X(), node.Y(), node.Z()])
-
-                    # Get triangles
-                    for i in range(1, triangulation.NbTriangles() + 1):
-                        tri = triangulation.Triangle(i)
-                        n1, n2, n3 = tri.Get()
-                        faces.append([3, vertex_offset + n1 - 1,
-                                     vertex_offset + n2 - 1,
-                                     vertex_offset + n3 - 1])
-
-                    vertex_offset += triangulation.NbNodes()
+                    n_nodes = triangulation.NbNodes()
+                    n_tris = triangulation.NbTriangles()
+
+                    # Get vertices (count known up front, so filled in place)
+                    node = triangulation.Node
+                    vertices = np.fromiter(
+                        (c for i in range(1, n_nodes + 1) for c in node(i).Coord()),
+                        dtype=np.float64, count=3 * n_nodes
+                    ).reshape(n_nodes, 3)
+                    if not location.IsIdentity():
+                        # One affine transform for the whole face
+                        trsf = location.Transformation()
+                        matrix = np.array([[trsf.Value(r, c) for c in range(1, 5)] for r in range(1, 4)])
+                        vertices = vertices @ matrix[:, :3].T + matrix[:, 3]
+
+                    # Get triangles (1-based node indices -> global 0-based)
+                    triangle = triangulation.Triangle
+                    tris = np.fromiter(
+                        (n for i in range(1, n_tris + 1) for n in triangle(i).Get()),
+                        dtype=np.int32, count=3 * n_tris
+                    ).reshape(n_tris, 3)
+                    tris += vertex_offset - 1
+
+                    vertex_blocks.append(vertices)
+                    face_blocks.append(tris)
+                    vertex_offset += n_nodes
 
                 explorer.Next()
 
-            if vertices and faces:
-                import numpy as np
-                vertices_array = np.array(vertices)
-                faces_array = np.hstack(faces)
-                return pv.PolyData(vertices_array, faces_array)
+            if vertex_offset and face_blocks:
+                # float32 points are ample for display and halve the VTK buffer
+                vertices_array = np.concatenate(vertex_blocks).astype(np.float32)
+                faces_ijk = np.concatenate(face_blocks)
+                # Plain (n, 3) connectivity, no per-triangle count column
+                return pv.PolyData.from_regular_faces(vertices_array, faces_ijk)
 
             return None
 
@@ -378,13 +469,11 @@ class StructuralElement(ABC):
         """
         solid = self.get_solid()
         if solid is None:
-            from src.geometry.point import Point3D
             return (Point3D.origin(), Point3D.origin())
 
         try:
             from OCP.Bnd import Bnd_Box
             from OCP.BRepBndLib import BRepBndLib
-            from src.geometry.point import Point3D
 
             bbox = Bnd_Box()
             BRepBndLib.Add_s(solid, bbox)
@@ -396,7 +485,6 @@ class StructuralElement(ABC):
             )
         except Exception as e:
             logger.error(f"Failed to get bounding box: {e}")
-            from src.geometry.point import Point3D
             return (Point3D.origin(), Point3D.origin())
 
     def calculate_signature(self, config: "ComparisonConfig") -> "PartSignature":
@@ -476,7 +564,6 @@ class StructuralElement(ABC):
             dy: Delta Y
             dz: Delta Z
         """
-        from src.geometry.vector import Vector3D
         self.move(Vector3D(dx, dy, dz))
 
     def copy(self) -> "StructuralElement":
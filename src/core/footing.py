@@ -4,7 +4,8 @@ Footing structural element for Schmekla.
 Represents foundation elements (pad footings, strip footings, etc.).
 """
 
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+import math
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
 from loguru import logger
 
 from src.core.element import StructuralElement, ElementType
@@ -46,6 +47,11 @@ class Footing(StructuralElement):
         """
         super().__init__()
 
+        # Plan corners derived from center/size/rotation, cleared on any change
+        self._corners: Optional[List[Point3D]] = None
+        # (inputs, formatted properties) from the last properties query
+        self._props_cache: Optional[Tuple[tuple, Dict[str, Any]]] = None
+
         self.center_point = center_point
         self.width = width
         self.length = length
@@ -57,9 +63,59 @@ class Footing(StructuralElement):
         self.footing_type: str = "pad"  # pad, strip, mat, pile_cap
         self.pedestal_width: float = 0   # Width of pedestal/pier if any
         self.pedestal_height: float = 0  # Height of pedestal/pier if any
-        self.rotation: float = 0.0       # Rotation around Z axis (degrees)
+        self.rotation = 0.0              # Rotation around Z axis (degrees)
+
+        logger.debug("Created Footing at {}, {}x{}x{}mm", center_point, width, length, depth)
+
+    @property
+    def center_point(self) -> Point3D:
+        """Footing center point (at top of footing)."""
+        return self._center_point
+
+    @center_point.setter
+    def center_point(self, value: Point3D):
+        self._center_point = value
+        self._corners = None
+
+    @property
+    def width(self) -> float:
+        """Footing width in X direction (mm)."""
+        return self._width
 
-        logger.debug(f"Created Footing at {center_point}, {width}x{length}x{depth}mm")
+    @width.setter
+    def width(self, value: float):
+        self._width = value
+        self._corners = None
+
+    @property
+    def length(self) -> float:
+        """Footing length in Y direction (mm)."""
+        return self._length
+
+    @length.setter
+    def length(self, value: float):
+        self._length = value
+        self._corners = None
+
+    @property
+    def rotation(self) -> float:
+        """Rotation around Z axis (degrees)."""
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value: float):
+        self._rotation = value
+        # Corners are rebuilt far more often than the rotation changes,
+        # so evaluate its trig once here
+        rotation_rad = math.radians(value)
+        self._cos_rot = math.cos(rotation_rad)
+        self._sin_rot = math.sin(rotation_rad)
+        self._corners = None
+
+    def invalidate(self):
+        """Mark element as needing geometry regeneration."""
+        super().invalidate()
+        self._corners = None
 
     @property
     def element_type(self) -> ElementType:
@@ -88,23 +144,25 @@ class Footing(StructuralElement):
     @property
     def corner_points(self) -> List[Point3D]:
         """Get footing corner points at top."""
+        if self._corners is None:
+            self._corners = self._compute_corner_points()
+        return list(self._corners)
+
+    def _compute_corner_points(self) -> List[Point3D]:
+        """Compute the corner points (uncached)."""
         half_w = self.width / 2
         half_l = self.length / 2
         z = self.center_point.z
         cx, cy = self.center_point.x, self.center_point.y
 
-        corners = [
-            Point3D(cx - half_w, cy - half_l, z),
-            Point3D(cx + half_w, cy - half_l, z),
-            Point3D(cx + half_w, cy + half_l, z),
-            Point3D(cx - half_w, cy + half_l, z),
-        ]
+        offsets = ((-half_w, -half_l), (half_w, -half_l), (half_w, half_l), (-half_w, half_l))
 
-        # Apply rotation if any
-        if self.rotation != 0:
-            corners = [c.rotate_around_z(self.rotation, self.center_point) for c in corners]
+        # Apply rotation if any (trig cached by the rotation setter)
+        if self._rotation != 0:
+            cos_a, sin_a = self._cos_rot, self._sin_rot
+            offsets = tuple((dx * cos_a - dy * sin_a, dx * sin_a + dy * cos_a) for dx, dy in offsets)
 
-        return corners
+        return [Point3D(cx + dx, cy + dy, z) for dx, dy in offsets]
 
     def generate_solid(self) -> Any:
         """
@@ -116,7 +174,7 @@ class Footing(StructuralElement):
         try:
             import cadquery as cq
 
-            logger.debug(f"Generating solid for footing {self._id}")
+            logger.debug("Generating solid for footing {}", self._id)
 
             cp = self.center_point
 
@@ -164,7 +222,16 @@ class Footing(StructuralElement):
         return create_ifc_footing(self, exporter)
 
     def _get_specific_properties(self) -> Dict[str, Any]:
-        """Get footing-specific properties."""
+        """Get footing-specific properties (reformatted only when their inputs change)."""
+        cp = self.center_point
+        key = (self.width, self.length, self.depth, self.footing_type, cp.x, cp.y, cp.z)
+        cached = self._props_cache
+        if cached is None or cached[0] != key:
+            cached = self._props_cache = (key, self._format_properties())
+        return cached[1]
+
+    def _format_properties(self) -> Dict[str, Any]:
+        """Format the footing-specific display properties."""
         return {
             "Width": f"{self.width} mm",
             "Length": f"{self.length} mm",
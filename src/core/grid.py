@@ -2,9 +2,13 @@
 Grid system implementation for Schmekla.
 """
 
+import bisect
+import math
+from operator import attrgetter
 from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
 from uuid import UUID, uuid4
+import numpy as np
 from loguru import logger
 
 from src.geometry.point import Point3D
@@ -23,6 +27,9 @@ class GridLine:
         return f"GridLine({self.name} @ {self.position})"
 
 
+_position = attrgetter("position")
+
+
 class GridSystem(StructuralElement):
     """
     Rectangular grid system defined by X and Y grid lines.
@@ -57,20 +64,17 @@ class GridSystem(StructuralElement):
 
     def add_x_grid(self, name: str, position: float):
         """Add a grid line perpendicular to X axis (vertical on plan)."""
-        self.x_grids.append(GridLine(name, position))
-        self.x_grids.sort(key=lambda g: g.position)
+        bisect.insort(self.x_grids, GridLine(name, position), key=_position)
         self.invalidate()
 
     def add_y_grid(self, name: str, position: float):
         """Add a grid line perpendicular to Y axis (horizontal on plan)."""
-        self.y_grids.append(GridLine(name, position))
-        self.y_grids.sort(key=lambda g: g.position)
+        bisect.insort(self.y_grids, GridLine(name, position), key=_position)
         self.invalidate()
 
     def add_z_level(self, name: str, elevation: float):
         """Add a level (Z plane)."""
-        self.z_levels.append(GridLine(name, elevation))
-        self.z_levels.sort(key=lambda g: g.position)
+        bisect.insort(self.z_levels, GridLine(name, elevation), key=_position)
         self.invalidate()
         
     def clear(self):
@@ -106,34 +110,31 @@ class GridSystem(StructuralElement):
             min_y = self.y_grids[0].position - self.extension_length
             max_y = self.y_grids[-1].position + self.extension_length
             
-            z = self.origin.z
-            
             # Create X-grids (lines along Y, at specific X)
             for x_grid in self.x_grids:
-                start = Point3D(x_grid.position, min_y, z)
-                end = Point3D(x_grid.position, max_y, z)
-                
-                # Apply rotation/origin transform
-                # TODO: Implement transform logic
-                
-                # Make line (using thin cylinder for visibility)
+                # Make line (using thin box for visibility)
                 line = cq.Workplane("XY").center(x_grid.position, (min_y + max_y)/2).box(50, max_y - min_y, 50)
-                lines.append(line)
+                lines.append(line.val().wrapped)
                 
             # Create Y-grids (lines along X, at specific Y)
             for y_grid in self.y_grids:
                 line = cq.Workplane("XY").center((min_x + max_x)/2, y_grid.position).box(max_x - min_x, 50, 50)
-                lines.append(line)
+                lines.append(line.val().wrapped)
                 
             if not lines:
                 return None
                 
-            # Combine
-            result = lines[0]
-            for l in lines[1:]:
-                result = result.union(l)
-                
-            return result.val().wrapped
+            # Combine as a compound: the lines only need to sit side by side
+            # for display, so skip fusing them with one boolean per line
+            from OCP.BRep import BRep_Builder
+            from OCP.TopoDS import TopoDS_Compound
+
+            builder = BRep_Builder()
+            compound = TopoDS_Compound()
+            builder.MakeCompound(compound)
+            for line in lines:
+                builder.Add(compound, line)
+            return self._place_shape(compound)
             
         except ImportError:
             return None
@@ -141,6 +142,77 @@ class GridSystem(StructuralElement):
             logger.error(f"Error generating grid solid: {e}")
             return None
 
+    def _to_global_xy(self, xy: np.ndarray) -> np.ndarray:
+        """Map (N, 2) grid-local plan coordinates to global X/Y (rotate about origin, then shift)."""
+        if self.rotation:
+            angle_rad = math.radians(self.rotation)
+            c, s = math.cos(angle_rad), math.sin(angle_rad)
+            xy = xy @ np.array([[c, s], [-s, c]])
+        return xy + (self.origin.x, self.origin.y)
+
+    def _place_shape(self, shape: Any) -> Any:
+        """Move a shape built in grid-local coordinates to the grid's origin and rotation."""
+        if not self.rotation and self.origin == Point3D(0, 0, 0):
+            return shape
+
+        from OCP.gp import gp_Ax1, gp_Dir, gp_Pnt, gp_Trsf, gp_Vec
+        from OCP.TopLoc import TopLoc_Location
+
+        rotation = gp_Trsf()
+        rotation.SetRotation(gp_Ax1(gp_Pnt(0, 0, 0), gp_Dir(0, 0, 1)), math.radians(self.rotation))
+        placement = gp_Trsf()
+        placement.SetTranslation(gp_Vec(self.origin.x, self.origin.y, self.origin.z))
+        return shape.Moved(TopLoc_Location(placement.Multiplied(rotation)))
+
+    def get_mesh(self) -> Any:
+        """
+        Get the display mesh: grid lines as line cells.
+
+        Lines are built directly as a PyVista mesh, so display never builds or
+        meshes the OCC solid (generate_solid remains for solid consumers).
+
+        Returns:
+            PyVista line mesh, or None if the grid is incomplete
+        """
+        if self._mesh is None:
+            self._mesh = self._build_line_mesh()
+        return self._mesh
+
+    def _build_line_mesh(self) -> Any:
+        """Build the grid line mesh (uncached)."""
+        if not self.x_grids or not self.y_grids:
+            return None
+
+        try:
+            import pyvista as pv
+        except ImportError as e:
+            logger.warning(f"Cannot build grid mesh: {e}")
+            return None
+
+        min_x = self.x_grids[0].position - self.extension_length
+        max_x = self.x_grids[-1].position + self.extension_length
+        min_y = self.y_grids[0].position - self.extension_length
+        max_y = self.y_grids[-1].position + self.extension_length
+        z = self.origin.z
+
+        xs = np.array([g.position for g in self.x_grids])
+        ys = np.array([g.position for g in self.y_grids])
+        n_x, n_y = len(xs), len(ys)
+
+        # Two endpoints per line: X-grids run along Y, Y-grids run along X
+        points = np.empty((2 * (n_x + n_y), 3))
+        points[:, 2] = z
+        points[0:2 * n_x:2, :2] = np.column_stack((xs, np.full(n_x, min_y)))
+        points[1:2 * n_x:2, :2] = np.column_stack((xs, np.full(n_x, max_y)))
+        points[2 * n_x::2, :2] = np.column_stack((np.full(n_y, min_x), ys))
+        points[2 * n_x + 1::2, :2] = np.column_stack((np.full(n_y, max_x), ys))
+        points[:, :2] = self._to_global_xy(points[:, :2])
+
+        # Line cells as [2, i, i + 1] per grid line
+        starts = np.arange(0, len(points), 2)
+        lines = np.column_stack((np.full(len(starts), 2), starts, starts + 1)).ravel()
+        return pv.PolyData(points, lines=lines)
+
     def to_ifc(self, exporter: "IFCExporter") -> Any:
         """Export grid to IFC."""
         try:
@@ -152,12 +224,16 @@ class GridSystem(StructuralElement):
         
     def get_intersections(self) -> List[Tuple[str, Point3D]]:
         """Get all grid intersection points with names (e.g. 'A-1')."""
-        intersections = []
-        for xg in self.x_grids:
-            for yg in self.y_grids:
-                name = f"{xg.name}-{yg.name}"
-                pt = Point3D(xg.position, yg.position, self.origin.z)
-                # TODO: Apply rotation
-                intersections.append((name, pt))
-        return intersections
+        if not self.x_grids or not self.y_grids:
+            return []
+
+        # X-major coordinate table, matching the x/y nesting of the names
+        xs = np.fromiter((g.position for g in self.x_grids), dtype=np.float64, count=len(self.x_grids))
+        ys = np.fromiter((g.position for g in self.y_grids), dtype=np.float64, count=len(self.y_grids))
+        xx, yy = np.meshgrid(xs, ys, indexing="ij")
+        coords = self._to_global_xy(np.column_stack((xx.ravel(), yy.ravel()))).tolist()
+
+        z = self.origin.z
+        names = [f"{xg.name}-{yg.name}" for xg in self.x_grids for yg in self.y_grids]
+        return [(name, Point3D(x, y, z)) for name, (x, y) in zip(names, coords)]
 
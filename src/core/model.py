@@ -4,7 +4,9 @@ Structural model (document) class for Schmekla.
 The main container for all structural elements in a project.
 """
 
-from typing import Dict, List, Optional, Any
+from collections import deque
+from typing import Deque, Dict, List, Optional, Any
+from itertools import islice
 from abc import ABC, abstractmethod
 from uuid import UUID
 from pathlib import Path
@@ -46,6 +48,9 @@ class StructuralModel(QObject):
         # Elements storage
         self._elements: Dict[UUID, StructuralElement] = {}
 
+        # Per-type index (insertion ordered) so type queries avoid full scans
+        self._by_type: Dict[ElementType, Dict[UUID, StructuralElement]] = {}
+
         # Grids and levels
         self._grids: List[GridSystem] = []
         self._levels: List[Level] = []
@@ -53,10 +58,10 @@ class StructuralModel(QObject):
         # Selection
         self._selected_ids: List[UUID] = []
 
-        # Undo/redo stacks
-        self._undo_stack: List["Command"] = []
-        self._redo_stack: List["Command"] = []
+        # Undo/redo stacks (the undo stack drops its oldest command when full)
         self._max_undo: int = 100
+        self._undo_stack: Deque["Command"] = deque(maxlen=self._max_undo)
+        self._redo_stack: List["Command"] = []
 
         # Modification tracking
         self._modified: bool = False
@@ -93,6 +98,34 @@ class StructuralModel(QObject):
         Returns:
             Element UUID
         """
+        self._insert_element(element)
+        self.model_changed.emit()
+
+        return element.id
+
+    def add_elements(self, elements: List[StructuralElement]) -> List[UUID]:
+        """
+        Add several elements to the model at once.
+
+        Each element is numbered and announced via element_added exactly as in
+        add_element, but model_changed is emitted only once for the whole batch.
+
+        Args:
+            elements: Elements to add
+
+        Returns:
+            List of element UUIDs, in input order
+        """
+        for element in elements:
+            self._insert_element(element)
+
+        if elements:
+            self.model_changed.emit()
+
+        return [element.id for element in elements]
+
+    def _insert_element(self, element: StructuralElement):
+        """Number, store and announce a single element (no model_changed signal)."""
         # Auto-assign part number using identical parts detection
         # Skip numbering for system elements (Grids, Levels, Welds, Bolts)
         if element.element_type not in [ElementType.GRID, ElementType.LEVEL, ElementType.WELD, ElementType.BOLT_GROUP]:
@@ -101,6 +134,7 @@ class StructuralModel(QObject):
                     element.part_number = self.numbering.get_number_for_element(element)
 
         self._elements[element.id] = element
+        self._by_type.setdefault(element.element_type, {})[element.id] = element
         self._modified = True
 
         hook = getattr(element, "on_added", None)
@@ -110,12 +144,9 @@ class StructuralModel(QObject):
             except Exception as e:
                 logger.warning(f"on_added hook failed for {element}: {e}")
 
-        logger.debug(f"Added element: {element}")
+        logger.debug("Added element: {}", element)
 
         self.element_added.emit(element)
-        self.model_changed.emit()
-
-        return element.id
 
     def remove_element(self, element_id: UUID) -> bool:
         """
@@ -132,13 +163,16 @@ class StructuralModel(QObject):
             return False
 
         element = self._elements.pop(element_id)
+        bucket = self._by_type.get(element.element_type)
+        if bucket is not None:
+            bucket.pop(element_id, None)
         self._modified = True
 
         # Remove from selection if selected
         if element_id in self._selected_ids:
             self._selected_ids.remove(element_id)
 
-        logger.debug(f"Removed element: {element}")
+        logger.debug("Removed element: {}", element)
 
         self.element_removed.emit(element)
         self.model_changed.emit()
@@ -149,9 +183,30 @@ class StructuralModel(QObject):
         """Get element by ID."""
         return self._elements.get(element_id)
 
-    def get_elements_by_type(self, element_type: ElementType) -> List[StructuralElement]:
-        """Get all elements of specific type."""
-        return [e for e in self._elements.values() if e.element_type == element_type]
+    def get_elements_by_type(
+        self, element_type: ElementType, limit: Optional[int] = None
+    ) -> List[StructuralElement]:
+        """
+        Get elements of specific type.
+
+        Args:
+            element_type: Type to look up
+            limit: Optional maximum number of elements to return
+
+        Returns:
+            Elements of that type, in insertion order
+        """
+        bucket = self._by_type.get(element_type)
+        if not bucket:
+            return []
+        if limit is None:
+            return list(bucket.values())
+        return list(islice(bucket.values(), limit))
+
+    def count_by_type(self, element_type: ElementType) -> int:
+        """Get number of elements of specific type without building a list."""
+        bucket = self._by_type.get(element_type)
+        return len(bucket) if bucket else 0
 
     def get_all_elements(self) -> List[StructuralElement]:
         """Get all elements."""
@@ -274,10 +329,6 @@ class StructuralModel(QObject):
         self._undo_stack.append(command)
         self._redo_stack.clear()
 
-        # Limit undo stack size
-        while len(self._undo_stack) > self._max_undo:
-            self._undo_stack.pop(0)
-
         self._modified = True
         self.model_changed.emit()
 
@@ -246,8 +246,8 @@ class NumberingManager:
         if signature in self._signature_cache:
             part_number = self._signature_cache[signature]
             self._part_counts[signature] = self._part_counts.get(signature, 0) + 1
-            logger.debug(f"Identical part found: {element.id} -> {part_number} "
-                        f"(count: {self._part_counts[signature]})")
+            logger.debug("Identical part found: {} -> {} (count: {})",
+                         element.id, part_number, self._part_counts[signature])
             return part_number
 
         # New signature - get next number in series
@@ -255,8 +255,8 @@ class NumberingManager:
         self._signature_cache[signature] = part_number
         self._part_counts[signature] = 1
 
-        logger.debug(f"New part signature: {element.id} -> {part_number} "
-                    f"(signature: {signature})")
+        logger.debug("New part signature: {} -> {} (signature: {})",
+                     element.id, part_number, signature)
         return part_number
 
     def _calculate_signature(self, element: "StructuralElement") -> PartSignature:
@@ -53,7 +53,7 @@ class Plate(StructuralElement):
         self.holes: List[dict] = []  # List of hole definitions
         self.normal = self._calculate_normal()
 
-        logger.debug(f"Created Plate with {len(points)} points, thickness {thickness}mm")
+        logger.debug("Created Plate with {} points, thickness {}mm", len(points), thickness)
 
     @property
     def element_type(self) -> ElementType:
@@ -111,7 +111,7 @@ class Plate(StructuralElement):
         try:
             import cadquery as cq
 
-            logger.debug(f"Generating solid for plate {self._id}")
+            logger.debug("Generating solid for plate {}", self._id)
 
             # Create 2D polygon and extrude
             # Convert 3D points to 2D workplane coordinates
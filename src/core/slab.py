@@ -55,7 +55,7 @@ class Slab(StructuralElement):
         self.level_name: str = ""       # Associated level name
         self.slab_type: str = "floor"   # floor, roof, landing, mat
 
-        logger.debug(f"Created Slab with {len(points)} points, thickness {thickness}mm")
+        logger.debug("Created Slab with {} points, thickness {}mm", len(points), thickness)
 
     @property
     def element_type(self) -> ElementType:
@@ -109,7 +109,7 @@ class Slab(StructuralElement):
         try:
             import cadquery as cq
 
-            logger.debug(f"Generating solid for slab {self._id}")
+            logger.debug("Generating solid for slab {}", self._id)
 
             # Create 2D polygon and extrude downward
             pts_2d = [(p.x, p.y) for p in self.points]
@@ -57,7 +57,7 @@ class Wall(StructuralElement):
         self.wall_type: str = "standard"  # standard, shear, retaining, partition
         self.base_offset: float = 0.0    # Offset from base point
 
-        logger.debug(f"Created Wall from {start_point} to {end_point}, h={height}mm, t={thickness}mm")
+        logger.debug("Created Wall from {} to {}, h={}mm, t={}mm", start_point, end_point, height, thickness)
 
     @property
     def element_type(self) -> ElementType:
@@ -111,7 +111,7 @@ class Wall(StructuralElement):
         try:
             import cadquery as cq
 
-            logger.debug(f"Generating solid for wall {self._id}")
+            logger.debug("Generating solid for wall {}", self._id)
 
             # Create wall as extruded rectangle along baseline
             # First create a rectangle perpendicular to baseline
@@ -9,8 +9,10 @@ import math
 from typing import TYPE_CHECKING, Tuple, Union
 import numpy as np
 
+# vector.py only imports Point3D for type checking, so this cannot cycle
+from src.geometry.vector import Vector3D
+
 if TYPE_CHECKING:
-    from src.geometry.vector import Vector3D
     from src.geometry.transform import Transform
 
 
@@ -18,7 +20,9 @@ class Point3D:
     """
     3D point with full coordinate operations.
 
-    All coordinates are stored in millimeters (mm).
+    All coordinates are stored in millimeters (mm). Points are treated as
+    immutable values: operations return new points and coordinates are never
+    modified in place, so instances can be shared freely.
     """
 
     __slots__ = ("x", "y", "z")
@@ -56,7 +60,6 @@ class Point3D:
 
     def __add__(self, other: "Vector3D") -> "Point3D":
         """Add a vector to this point, returning a new point."""
-        from src.geometry.vector import Vector3D
         if not isinstance(other, Vector3D):
             raise TypeError(f"Cannot add {type(other)} to Point3D")
         return Point3D(self.x + other.x, self.y + other.y, self.z + other.z)
@@ -68,7 +71,6 @@ class Point3D:
         Point - Point = Vector (displacement between points)
         Point - Vector = Point (move point by negative vector)
         """
-        from src.geometry.vector import Vector3D
         if isinstance(other, Point3D):
             return Vector3D(self.x - other.x, self.y - other.y, self.z - other.z)
         elif isinstance(other, Vector3D):
@@ -208,8 +210,8 @@ class Point3D:
             raise ImportError("OpenCascade (OCC) not available")
 
     def copy(self) -> "Point3D":
-        """Create a copy of this point."""
-        return Point3D(self.x, self.y, self.z)
+        """Return this point (points are immutable values, so sharing is safe)."""
+        return self
 
     def is_close_to(self, other: "Point3D", tolerance: float = 1e-6) -> bool:
         """
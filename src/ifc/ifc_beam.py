@@ -35,7 +35,7 @@ def create_ifc_beam(beam: "Beam", exporter: "IFCExporter"):
     ifc_beam = ifcopenshell.api.run(
         "root.create_entity", ifc,
         ifc_class="IfcBeam",
-        name=beam.name or f"B-{str(beam.id)[:8]}"
+        name=beam.name or f"B-{beam.short_id}"
     )
 
     # Create profile definition
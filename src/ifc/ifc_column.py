@@ -32,7 +32,7 @@ def create_ifc_column(column: "Column", exporter: "IFCExporter") -> Any:
     ifc_column = ifcopenshell.api.run(
         "root.create_entity", ifc,
         ifc_class="IfcColumn",
-        name=column.name or f"Column_{str(column.id)[:8]}"
+        name=column.name or f"Column_{column.short_id}"
     )
 
     # Create profile definition
@@ -42,7 +42,7 @@ def create_ifc_curved_beam(curved_beam: "CurvedBeam", exporter: "IFCExporter"):
     ifc_beam = ifcopenshell.api.run(
         "root.create_entity", ifc,
         ifc_class="IfcBeam",
-        name=curved_beam.name or f"CB-{str(curved_beam.id)[:8]}"
+        name=curved_beam.name or f"CB-{curved_beam.short_id}"
     )
 
     # Create profile definition
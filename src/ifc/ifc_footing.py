@@ -41,7 +41,7 @@ def create_ifc_footing(footing: "Footing", exporter: "IFCExporter") -> Any:
     ifc_footing = ifcopenshell.api.run(
         "root.create_entity", ifc,
         ifc_class="IfcFooting",
-        name=footing.name or f"Footing_{str(footing.id)[:8]}",
+        name=footing.name or f"Footing_{footing.short_id}",
         predefined_type=predefined_type
     )
 
@@ -32,7 +32,7 @@ def create_ifc_plate(plate: "Plate", exporter: "IFCExporter") -> Any:
     ifc_plate = ifcopenshell.api.run(
         "root.create_entity", ifc,
         ifc_class="IfcPlate",
-        name=plate.name or f"Plate_{str(plate.id)[:8]}"
+        name=plate.name or f"Plate_{plate.short_id}"
     )
 
     # Create polygon outline for profile
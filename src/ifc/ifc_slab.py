@@ -41,7 +41,7 @@ def create_ifc_slab(slab: "Slab", exporter: "IFCExporter") -> Any:
     ifc_slab = ifcopenshell.api.run(
         "root.create_entity", ifc,
         ifc_class="IfcSlab",
-        name=slab.name or f"Slab_{str(slab.id)[:8]}",
+        name=slab.name or f"Slab_{slab.short_id}",
         predefined_type=predefined_type
     )
 
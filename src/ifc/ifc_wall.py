@@ -41,7 +41,7 @@ def create_ifc_wall(wall: "Wall", exporter: "IFCExporter") -> Any:
     ifc_wall = ifcopenshell.api.run(
         "root.create_entity", ifc,
         ifc_class="IfcWall",
-        name=wall.name or f"Wall_{str(wall.id)[:8]}",
+        name=wall.name or f"Wall_{wall.short_id}",
         predefined_type=predefined_type
     )
 
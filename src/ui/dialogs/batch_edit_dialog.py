@@ -227,7 +227,7 @@ class BatchEditDialog(QDialog):
                 count += 1
             except Exception as e:
                 logger.warning(f"Could not update element {elem.id}: {e}")
-                failures.append(str(elem.id)[:8])
+                failures.append(elem.short_id)
 
         logger.info(f"Batch edit applied to {count}/{len(self.elements)} elements")
 
@@ -462,7 +462,7 @@ class MainWindow(QMainWindow):
     def _on_element_added(self, element):
         """Handle element added to model."""
         item = QTreeWidgetItem([
-            element.name or str(element.id)[:8],
+            element.name or element.short_id,
             element.element_type.value
         ])
         item.setData(0, Qt.UserRole, element.id)
@@ -968,14 +968,14 @@ class Viewport3D(QWidget):
             
             elif elem_type == 'bolt_group':
                 # Draw bolts as cylinders
-                if hasattr(element, 'get_bolt_positions'):
-                    positions = element.get_bolt_positions()
-                    if positions:
+                if hasattr(element, 'get_bolt_position_arrays'):
+                    positions = element.get_bolt_position_arrays()
+                    if positions.size:
                         meshes = []
                         dia = getattr(element, 'bolt_diameter', 20.0)
                         # Default Z direction for now
-                        for pos in positions:
-                            cyl = pv.Cylinder(center=(pos.x, pos.y, pos.z), direction=(0,0,1), radius=dia/2, height=100)
+                        for center in zip(*positions):
+                            cyl = pv.Cylinder(center=center, direction=(0,0,1), radius=dia/2, height=100)
                             meshes.append(cyl)
                         
                         if meshes:
@@ -0,0 +1,42 @@
+
+import sys
+import os
+sys.path.append(os.getcwd())
+
+import numpy as np
+
+from src.core.beam import Beam
+from src.core.profile import Profile
+from src.geometry.point import Point3D
+
+
+def test_degenerate_section_has_no_solid():
+    # SHS sections carry no outline width, so the viewport must fall back
+    beam = Beam(Point3D(0, 0, 0), Point3D(3000, 0, 0), Profile.from_name("SHS 60x60x3"))
+    assert beam.generate_solid() is None
+    assert beam.get_mesh() is None
+
+
+def test_properties_follow_changes():
+    beam = Beam(Point3D(0, 0, 0), Point3D(5000, 0, 0))
+    props = beam.get_properties()
+    assert props["Length"] == "5000.0 mm"
+    assert props["Camber"] == "0.0 mm"
+
+    beam.end_point = Point3D(6000, 0, 0)
+    beam.camber = 20.0
+    beam.start_offsets.dx = 15.0
+    props = beam.get_properties()
+    assert props["Length"] == "6000.0 mm"
+    assert props["Camber"] == "20.0 mm"
+    assert props["Start Offset DX"] == "15.0 mm"
+
+
+def test_equal_beams_do_not_share_solids():
+    first = Beam(Point3D(0, 0, 0), Point3D(6000, 0, 0))
+    second = Beam(Point3D(0, 0, 0), Point3D(6000, 0, 0))
+    moved = Beam(Point3D(0, 2000, 0), Point3D(6000, 2000, 0))
+
+    assert not first.get_solid().IsPartner(second.get_solid())
+    assert first.get_mesh().bounds[2] == second.get_mesh().bounds[2]
+    assert np.isclose(moved.get_mesh().bounds[2], first.get_mesh().bounds[2] + 2000)
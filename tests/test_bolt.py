@@ -0,0 +1,57 @@
+
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from src.core.bolt import BoltGroup, _parse_spacing_cached
+from src.geometry.point import Point3D
+from src.geometry.vector import Vector3D
+
+
+def test_parse_spacing():
+    assert _parse_spacing_cached("") == ()
+    assert _parse_spacing_cached("100") == (100.0,)
+    assert _parse_spacing_cached("100 2*50 100") == (100.0, 50.0, 50.0, 100.0)
+    assert _parse_spacing_cached("  75.5\t1e2 ") == (75.5, 100.0)
+
+
+def test_parse_spacing_ignores_malformed_tokens():
+    assert _parse_spacing_cached("x50") == ()
+    assert _parse_spacing_cached("2*x") == ()
+    assert _parse_spacing_cached("2*50*3") == ()
+    assert _parse_spacing_cached("3 * 50") == (3.0, 50.0)
+    assert _parse_spacing_cached("100 abc 2*50") == (100.0, 50.0, 50.0)
+
+
+def test_bolt_group_parse_spacing_matches_cache():
+    bolts = BoltGroup()
+    assert list(bolts._parse_spacing("100 2*50")) == [100.0, 50.0, 50.0]
+
+
+def test_bolt_positions_grid_order():
+    bolts = BoltGroup(
+        origin=Point3D(100, 200, 300),
+        direction_x=Vector3D(0, 2, 0),
+        direction_y=Vector3D(0, 0, 1),
+        spacing_x="100 2*50",
+        spacing_y="75",
+    )
+    positions = bolts.get_bolt_positions()
+    assert all(isinstance(p, Point3D) for p in positions)
+
+    # x-row major: every y for the first x before moving along x
+    expected = [
+        Point3D(100, 200 + x, 300 + y)
+        for x in (0.0, 100.0, 150.0, 200.0)
+        for y in (0.0, 75.0)
+    ]
+    assert positions == expected
+
+    arrays = bolts.get_bolt_position_arrays()
+    assert arrays.size == len(expected)
+    assert [Point3D(x, y, z) for x, y, z in zip(*arrays)] == expected
+
+
+def test_bolt_positions_single_bolt():
+    bolts = BoltGroup(spacing_x="", spacing_y="")
+    assert bolts.get_bolt_positions() == [Point3D(0, 0, 0)]
@@ -0,0 +1,62 @@
+
+import sys
+import os
+sys.path.append(os.getcwd())
+import stat
+
+import src.claude_integration.claude_bridge as claude_bridge
+from src.claude_integration.claude_bridge import ClaudeBridge
+from src.core.model import StructuralModel
+
+
+_BEAM_BLOCK = (
+    '```schmekla-command\\n'
+    '{"command": "create_beam", "params": {"start": [0,0,0], "end": [6000,0,0], '
+    '"profile": "UB 305x165x40"}}\\n'
+    '```\\n'
+)
+
+
+def _fake_cli(tmp_path, tail):
+    """Write an executable stand-in for the Claude CLI that emits one beam command."""
+    script = tmp_path / "claude"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import sys, time\n"
+        "sys.stdin.read()\n"
+        f"sys.stdout.write('Creating a beam.\\n{_BEAM_BLOCK}')\n"
+        "sys.stdout.flush()\n"
+        f"{tail}\n"
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script)
+
+
+def test_failed_cli_reports_applied_commands(tmp_path, monkeypatch):
+    bridge = ClaudeBridge(StructuralModel())
+    cli = _fake_cli(tmp_path, "sys.stderr.write('permission denied'); sys.exit(1)")
+    monkeypatch.setattr(bridge, "_get_claude_cli", lambda: cli)
+
+    response = bridge.send_prompt("add a beam")
+    assert response.startswith("Error: Claude CLI permission issue")
+    assert "Commands already applied to the model: create_beam" in response
+    assert len(bridge.model.get_all_elements()) == 1
+
+
+def test_timed_out_cli_reports_applied_commands(tmp_path, monkeypatch):
+    bridge = ClaudeBridge(StructuralModel())
+    cli = _fake_cli(tmp_path, "time.sleep(30)")
+    monkeypatch.setattr(bridge, "_get_claude_cli", lambda: cli)
+    monkeypatch.setattr(claude_bridge, "_CLI_TIMEOUT", 1)
+
+    response = bridge.send_prompt("add a beam")
+    assert response.startswith("Error: Claude request timed out")
+    assert "create_beam" in response
+
+
+def test_read_file_translates_all_newline_styles(tmp_path):
+    bridge = ClaudeBridge(StructuralModel())
+    path = tmp_path / "spec.txt"
+    path.write_bytes(b"unix\nwindows\r\nmac\rend")
+
+    assert bridge._read_file_safely(path) == "unix\nwindows\nmac\nend"
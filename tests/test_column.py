@@ -0,0 +1,95 @@
+
+import sys
+import os
+sys.path.append(os.getcwd())
+import copy
+import pickle
+
+from src.core.column import Column
+from src.core.element import EndPointOffsets
+from src.geometry.point import Point3D
+
+
+def test_offsets_editable_through_getter():
+    col = Column(Point3D(0, 0, 0), Point3D(0, 0, 3000))
+    col.start_offsets.dx = 10
+    col.end_offsets.dz = -5
+
+    assert col.start_offsets.dx == 10
+    assert col.base_offset == 10
+    assert col.end_offsets.dz == -5
+
+    # Other columns keep zero offsets
+    other = Column(Point3D(0, 0, 0), Point3D(0, 0, 3000))
+    assert other.start_offsets.is_zero()
+    assert other.end_offsets.is_zero()
+
+
+def test_offsets_copy_deepcopy_pickle():
+    col = Column(Point3D(0, 0, 0), Point3D(0, 0, 3000))
+
+    clone = copy.deepcopy(col)
+    assert clone.start_offsets.is_zero()
+    clone.start_offsets.dx = 25
+    assert col.start_offsets.dx == 0
+
+    offsets = pickle.loads(pickle.dumps(col.start_offsets))
+    assert isinstance(offsets, EndPointOffsets)
+    assert offsets.is_zero()
+
+    col.top_offset = 40
+    copied = col.copy()
+    copied.top_offset = 60
+    assert col.top_offset == 40
+    assert copied.top_offset == 60
+
+
+def test_fresh_column_deepcopies_untouched():
+    # A column whose offsets were never read still holds the shared sentinel
+    col = Column(Point3D(1000, 0, 0), Point3D(1000, 0, 4000))
+    clone = copy.deepcopy(col)
+    clone.base_offset = 15
+    assert clone.base_offset == 15
+    assert col.base_offset == 0
+
+
+def test_properties_follow_in_place_offset_edits():
+    col = Column(Point3D(0, 0, 0), Point3D(0, 0, 3000))
+    assert col.get_properties()["Start Offset DX"] == "0.0 mm"
+
+    col.start_offsets.dx = 25
+    col.end_offsets.dy = -10
+    props = col.get_properties()
+    assert props["Start Offset DX"] == "25.0 mm"
+    assert props["End Offset DY"] == "-10.0 mm"
+
+    col.end_point = Point3D(0, 0, 4000)
+    assert col.get_properties()["Height"] == "4000.0 mm"
+    assert col.copy().get_properties()["Start Offset DX"] == "25.0 mm"
+
+
+def test_copy_is_independent_and_keeps_type():
+    class TaggedColumn(Column):
+        pass
+
+    col = TaggedColumn(Point3D(0, 0, 0), Point3D(0, 0, 3000), rotation=15, name="C1")
+    col.splice_location = 1500.0
+    col.tag = "extra"  # attribute added after __init__
+    col.top_offset = 30
+    col.set_user_attribute("comment", "x")
+
+    clone = col.copy()
+    assert type(clone) is TaggedColumn
+    assert clone.id != col.id
+    assert clone.name == "C1"
+    assert clone.get_user_attribute("comment") is None  # element state starts fresh
+    assert clone.rotation == 15
+    assert clone.splice_location == 1500.0
+    assert clone.tag == "extra"
+    assert clone.height == col.height
+
+    clone.top_offset = 50
+    assert col.top_offset == 30
+
+    # stdlib copy keeps its usual meaning (same ID, shallow)
+    assert copy.copy(col).id == col.id
@@ -0,0 +1,27 @@
+
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from src.core.curved_beam import CurvedBeam
+from src.core.profile import Profile
+from src.geometry.point import Point3D
+
+
+def _arch():
+    return CurvedBeam(Point3D(0, 0, 0), Point3D(20000, 0, 0), 3000, Profile.from_name("UB 406x178x54"))
+
+
+def test_coarser_mesh_deflection_reduces_cells():
+    beam = _arch()
+    beam.mesh_deflection = 0.5
+    fine = beam.get_mesh().n_cells
+
+    # The solid already carries the fine triangulation; coarsening must replace it
+    beam.mesh_deflection = 20.0
+    coarse = beam.get_mesh().n_cells
+    assert coarse < fine
+
+    fresh = _arch()
+    fresh.mesh_deflection = 20.0
+    assert coarse == fresh.get_mesh().n_cells
@@ -0,0 +1,39 @@
+
+import sys
+import os
+sys.path.append(os.getcwd())
+import time
+from datetime import datetime
+
+from src.core.drawing import Drawing, DrawingStatus, DrawingType
+
+
+def test_modification_date_is_time_of_change():
+    drawing = Drawing("A.1", "Plan", DrawingType.GENERAL_ARRANGEMENT)
+    assert drawing.modification_date == drawing.creation_date
+
+    before = datetime.now()
+    drawing.mark_as_modified()
+    after = datetime.now()
+    time.sleep(0.2)
+    assert before <= drawing.modification_date <= after
+    assert drawing.status == DrawingStatus.MODIFIED
+
+    drawing.update_status(DrawingStatus.ISSUED)
+    changed = datetime.now()
+    time.sleep(0.2)
+    assert abs((drawing.modification_date - changed).total_seconds()) < 0.1
+
+
+def test_dates_accepted_as_constructor_arguments():
+    created = datetime(2020, 1, 1)
+    modified = datetime(2021, 6, 1)
+    drawing = Drawing(
+        "A.2", "Section", DrawingType.ASSEMBLY,
+        creation_date=created, modification_date=modified,
+    )
+    assert drawing.creation_date == created
+    assert drawing.modification_date == modified
+
+    drawing.modification_date = datetime(2022, 1, 1)
+    assert drawing.modification_date == datetime(2022, 1, 1)
@@ -0,0 +1,26 @@
+
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from src.core.model import StructuralModel
+from src.core.drawing import DrawingType
+
+
+def test_drawings_by_type_after_create_and_delete():
+    manager = StructuralModel().drawing_manager
+    ga_1 = manager.create_drawing("GA1", "Plan", DrawingType.GENERAL_ARRANGEMENT)
+    part = manager.create_drawing("P1", "Part", DrawingType.SINGLE_PART)
+    ga_2 = manager.create_drawing("GA2", "Elevation", DrawingType.GENERAL_ARRANGEMENT)
+
+    assert manager.get_drawings_by_type(DrawingType.GENERAL_ARRANGEMENT) == [ga_1, ga_2]
+    assert manager.get_drawings_by_type(DrawingType.SINGLE_PART) == [part]
+    assert manager.get_drawings_by_type(DrawingType.CAST_UNIT) == []
+
+    manager.delete_drawing(ga_1.id)
+    manager.delete_drawing(part.id)
+    manager.delete_drawing(part.id)  # deleting twice is harmless
+
+    assert manager.get_drawings_by_type(DrawingType.GENERAL_ARRANGEMENT) == [ga_2]
+    assert manager.get_drawings_by_type(DrawingType.SINGLE_PART) == []
+    assert manager.get_all_drawings() == [ga_2]
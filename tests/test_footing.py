@@ -0,0 +1,37 @@
+
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from src.core.footing import Footing
+from src.geometry.point import Point3D
+from src.geometry.vector import Vector3D
+
+
+def test_corner_cache_follows_changes():
+    footing = Footing(Point3D(1000, 2000, 0), 1500, 2000, 600)
+    assert footing.corner_points[0] == Point3D(250, 1000, 0)
+
+    # Returned lists are copies of the cache
+    footing.corner_points.clear()
+    assert len(footing.corner_points) == 4
+
+    footing.width = 500
+    assert footing.corner_points[0] == Point3D(750, 1000, 0)
+
+    footing.length = 1000
+    assert footing.corner_points[0] == Point3D(750, 1500, 0)
+
+    footing.move(Vector3D(100, 0, -50))
+    assert footing.corner_points[0] == Point3D(850, 1500, -50)
+
+    footing.rotation = 90
+    assert footing.corner_points[0] == Point3D(1600, 1750, -50)
+
+    footing.center_point = Point3D(0, 0, 0)
+    footing.rotation = 0
+    assert footing.corner_points == [
+        Point3D(-250, -500, 0), Point3D(250, -500, 0),
+        Point3D(250, 500, 0), Point3D(-250, 500, 0),
+    ]
+
@@ -0,0 +1,29 @@
+
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from src.core.grid import GridSystem
+from src.geometry.point import Point3D
+
+
+class _Grid(GridSystem):
+    def move(self, vector):
+        pass
+
+
+def test_intersections_follow_origin_and_rotation():
+    grid = _Grid(origin=Point3D(1000, 500, 300), rotation=90)
+    grid.add_x_grid("2", 6000)
+    grid.add_x_grid("1", 0)
+    grid.add_y_grid("A", 0)
+
+    names = [name for name, _ in grid.get_intersections()]
+    points = dict(grid.get_intersections())
+    assert names == ["1-A", "2-A"]
+    assert points["1-A"] == Point3D(1000, 500, 300)
+    assert points["2-A"] == Point3D(1000, 6500, 300)
+
+    mesh = grid.get_mesh()
+    assert mesh.n_cells == 3
+    assert mesh.bounds[4] == mesh.bounds[5] == 300